@@ -9,32 +9,46 @@ Contains admin interfaces for:
 """
 
 from django.contrib import admin
+from django.core.cache import cache, caches
+from django.db import transaction
 from django.utils.html import format_html
+
+from .admin_mixins import ListOnlyFieldsMixin
+from .context_processors.admin_counts import ADMIN_COUNTS_CACHE_KEY
 from .models import SiteSetting, ContactMessage, Testimonial, FAQ, NewsletterSubscriber
+from .utils.helpers import FAQ_CACHE_KEYS
 
 
 class SiteSettingAdmin(admin.ModelAdmin):
     """Admin interface for Site Settings"""
     list_display = ('site_name', 'contact_email', 'contact_phone', 'updated_at')
     list_editable = ('contact_email', 'contact_phone')
+    list_select_related = True
 
     def has_add_permission(self, request):
-        """Allow only one site settings instance"""
-        return not SiteSetting.objects.exists()
+        """Allow only one site settings instance (existence flag is cached)"""
+        exists = cache.get('sitesetting_exists')
+        if exists is None:
+            exists = SiteSetting.objects.exists()
+            cache.set('sitesetting_exists', exists, 3600)
+        return not exists
 
     def has_delete_permission(self, request, obj=None):
         """Prevent deletion of site settings"""
         return False
 
 
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Contact Messages"""
+    # Changelist columns only; the change form still loads full rows
+    list_only_fields = ('name', 'email', 'subject', 'is_read', 'created_at')
     list_display = ('name', 'email', 'subject', 'is_read', 'created_at')
     list_filter = ('is_read', 'subject', 'created_at')
     search_fields = ('name', 'email', 'message')
     list_editable = ('is_read',)
     readonly_fields = ('name', 'email', 'phone', 'subject', 'message', 'ip_address', 'created_at')
     date_hierarchy = 'created_at'
+    list_select_related = True
 
     def get_readonly_fields(self, request, obj=None):
         """Make all fields readonly for existing objects"""
@@ -47,6 +61,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
     def mark_as_read(self, request, queryset):
         """Mark selected messages as read"""
         updated = queryset.update(is_read=True)
+        cache.delete(ADMIN_COUNTS_CACHE_KEY)
         self.message_user(request, f'{updated} message(s) marked as read.')
 
     mark_as_read.short_description = "Mark selected messages as read"
@@ -54,18 +69,23 @@ class ContactMessageAdmin(admin.ModelAdmin):
     def mark_as_unread(self, request, queryset):
         """Mark selected messages as unread"""
         updated = queryset.update(is_read=False)
+        cache.delete(ADMIN_COUNTS_CACHE_KEY)
         self.message_user(request, f'{updated} message(s) marked as unread.')
 
     mark_as_unread.short_description = "Mark selected messages as unread"
 
 
-class TestimonialAdmin(admin.ModelAdmin):
+class TestimonialAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Testimonials"""
+    # Changelist columns only (photo included for previews)
+    list_only_fields = ('client_name', 'client_location', 'client_type', 'rating',
+                        'is_featured', 'created_at', 'client_photo')
     list_display = ('client_name', 'client_location', 'client_type', 'rating', 'is_featured', 'created_at')
     list_filter = ('client_type', 'rating', 'is_featured', 'created_at')
     search_fields = ('client_name', 'client_location', 'content')
     list_editable = ('is_featured', 'rating')
     readonly_fields = ('created_at', 'display_client_photo')
+    list_select_related = True
     fieldsets = (
         ('Client Information', {
             'fields': ('client_name', 'client_location', 'client_type', 'client_photo', 'display_client_photo')
@@ -93,13 +113,49 @@ class TestimonialAdmin(admin.ModelAdmin):
     display_client_photo.short_description = "Current Photo"
 
 
-class FAQAdmin(admin.ModelAdmin):
+class FAQAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for FAQs"""
+    # Skip loading the answer text on the changelist
+    list_only_fields = ('question', 'category', 'order', 'is_active')
     list_display = ('question', 'category', 'order', 'is_active')
     list_filter = ('category', 'is_active')
     search_fields = ('question', 'answer')
     list_editable = ('order', 'is_active', 'category')
     ordering = ('order', 'question')
+    list_select_related = True
+
+    def changelist_view(self, request, extra_context=None):
+        """
+        Coalesce inline list_editable saves into one bulk UPDATE —
+        reordering N FAQs costs 1 round-trip instead of N
+        """
+        is_bulk_edit = (
+            request.method == 'POST' and '_save' in request.POST
+            and 'form-TOTAL_FORMS' in request.POST
+        )
+        if not is_bulk_edit:
+            return super().changelist_view(request, extra_context)
+
+        request._faq_bulk_edit = []
+        with transaction.atomic():
+            response = super().changelist_view(request, extra_context)
+            if request._faq_bulk_edit:
+                FAQ.objects.bulk_update(
+                    request._faq_bulk_edit, ['order', 'is_active', 'category'])
+                # bulk_update emits no post_save signals, so the cache
+                # invalidation in core/signals.py never fires on this
+                # path — drop the FAQ lookups and cached pages here
+                cache.delete_many(FAQ_CACHE_KEYS)
+                caches['pages'].clear()
+        return response
+
+    def save_model(self, request, obj, form, change):
+        """Collect changelist edits for the bulk update instead of saving each row"""
+        collected = getattr(request, '_faq_bulk_edit', None)
+        if change and collected is not None:
+            collected.append(obj)
+        else:
+            super().save_model(request, obj, form, change)
 
 
 class NewsletterSubscriberAdmin(admin.ModelAdmin):
@@ -108,11 +164,13 @@ class NewsletterSubscriberAdmin(admin.ModelAdmin):
     list_filter = ('is_active', 'subscribed_at')
     search_fields = ('email',)
     readonly_fields = ('subscribed_at',)
+    list_select_related = True
     actions = ['activate_subscribers', 'deactivate_subscribers']
 
     def activate_subscribers(self, request, queryset):
         """Activate selected subscribers"""
         updated = queryset.update(is_active=True)
+        cache.delete(ADMIN_COUNTS_CACHE_KEY)
         self.message_user(request, f'{updated} subscriber(s) activated.')
 
     activate_subscribers.short_description = "Activate selected subscribers"
@@ -120,6 +178,7 @@ class NewsletterSubscriberAdmin(admin.ModelAdmin):
     def deactivate_subscribers(self, request, queryset):
         """Deactivate selected subscribers"""
         updated = queryset.update(is_active=False)
+        cache.delete(ADMIN_COUNTS_CACHE_KEY)
         self.message_user(request, f'{updated} subscriber(s) deactivated.')
 
     deactivate_subscribers.short_description = "Deactivate selected subscribers"
@@ -0,0 +1,30 @@
+"""
+Shared Admin Building Blocks
+Changelist helpers reused by the app admins:
+- Column-restricted changelist SELECTs via list_only_fields
+"""
+
+from django.contrib.admin.views.main import ChangeList
+
+
+class OnlyFieldsChangeList(ChangeList):
+    """
+    ChangeList that restricts the SELECT to the columns the list renders
+
+    Applying only() here — rather than in ModelAdmin.get_queryset —
+    keeps change forms on full rows, where deferred fields would
+    re-query per field.
+    """
+
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        only = self.model_admin.list_only_fields
+        return queryset.only(*only) if only else queryset
+
+
+class ListOnlyFieldsMixin:
+    """Opt a ModelAdmin's changelist into column-restricted SELECTs"""
+    list_only_fields = ()
+
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
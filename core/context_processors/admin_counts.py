@@ -1,12 +1,30 @@
+from django.core.cache import cache
+
+ADMIN_COUNTS_CACHE_KEY = 'admin_counts_v1'
+ADMIN_COUNTS_TTL = 60  # seconds
+
+
+def _load_admin_counts():
+    """Compute the sidebar counts for staff pages in a handful of COUNTs"""
+    from django.contrib.auth.models import User
+    from payments.models import PaymentDispute
+    from users.models import ArtisanProfile
+
+    return {
+        'verification_count': ArtisanProfile.objects.filter(is_verified=False).count(),
+        'dispute_count': PaymentDispute.objects.filter(
+            status__in=['open', 'under_review']).count(),
+        'anomaly_count': 0,  # Anomaly detection not implemented yet
+        'active_users_count': User.objects.filter(is_active=True).count(),
+    }
+
+
 def admin_counts(request):
-    """Context processor for admin counts"""
+    """Context processor for admin counts (cached with a short TTL)"""
     if request.user.is_authenticated and request.user.is_staff:
-        # In production, these would come from your database
-        # For now, we'll use mock data
-        return {
-            'verification_count': 12,
-            'dispute_count': 5,
-            'anomaly_count': 3,
-            'active_users_count': 2456,
-        }
+        data = cache.get(ADMIN_COUNTS_CACHE_KEY)
+        if data is None:
+            data = _load_admin_counts()
+            cache.set(ADMIN_COUNTS_CACHE_KEY, data, ADMIN_COUNTS_TTL)
+        return data
     return {}
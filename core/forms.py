@@ -7,11 +7,17 @@ Contains Django forms for:
 - Site search
 """
 
+import re
+
 from django import forms
-from django.core.validators import validate_email
-from django.core.exceptions import ValidationError
+from django.conf import settings
 
 from .models import ContactMessage, NewsletterSubscriber
+from .tasks import dispatch_after_commit, send_newsletter_welcome
+
+# Accepted phone characters: digits plus '+', '-' and spaces,
+# with at least one digit required
+_PHONE_RE = re.compile(r'^[+\s-]*\d[+\-\d\s]*$')
 
 
 class ContactForm(forms.ModelForm):
@@ -57,24 +63,16 @@ class ContactForm(forms.ModelForm):
         }
         error_messages = {
             'name': {'required': 'Please enter your name.'},
-            'email': {'required': 'Please enter your email address.'},
+            'email': {'required': 'Please enter your email address.',
+                      'invalid': 'Please enter a valid email address.'},
             'message': {'required': 'Please enter your message.'},
             'subject': {'required': 'Please select a subject.'},
         }
 
-    def clean_email(self):
-        """Validate email format"""
-        email = self.cleaned_data.get('email')
-        try:
-            validate_email(email)
-        except ValidationError:
-            raise forms.ValidationError('Please enter a valid email address.')
-        return email
-
     def clean_phone(self):
         """Basic phone number validation"""
         phone = self.cleaned_data.get('phone', '').strip()
-        if phone and not phone.replace(' ', '').replace('+', '').replace('-', '').isdigit():
+        if phone and not _PHONE_RE.match(phone):
             raise forms.ValidationError('Please enter a valid phone number.')
         return phone
 
@@ -103,23 +101,45 @@ class NewsletterForm(forms.ModelForm):
         labels = {
             'email': 'Email Address'
         }
+        error_messages = {
+            'email': {'invalid': 'Please enter a valid email address.'},
+        }
 
-    def clean_email(self):
-        """Validate email and check if already subscribed"""
-        email = self.cleaned_data.get('email')
-
-        # Basic email validation
-        try:
-            validate_email(email)
-        except ValidationError:
-            raise forms.ValidationError('Please enter a valid email address.')
-
-        # Check if already subscribed and active
-        existing = NewsletterSubscriber.objects.filter(email=email, is_active=True).exists()
-        if existing:
-            raise forms.ValidationError('This email is already subscribed to our newsletter.')
+    def validate_unique(self):
+        """Skip the default unique check — save() upserts, so resubscribing is fine"""
+        pass
 
-        return email
+    def clean_email(self):
+        """Normalize case so each address maps to exactly one subscriber row"""
+        return self.cleaned_data['email'].lower()
+
+    def save(self, commit=True):
+        """
+        Upsert the subscriber in a single round-trip
+
+        One INSERT ... ON CONFLICT DO UPDATE covers new subscribers and
+        reactivations alike — no SELECT-then-save round-trips or race
+        """
+        email = self.cleaned_data['email']
+
+        # bulk_create emits no post_save, so the DEBUG-only welcome
+        # email receiver in core/signals.py never fires here — dispatch
+        # the task directly for genuinely new subscribers. The extra
+        # queries run only in development, matching the signal gating;
+        # the production path stays a single statement
+        is_new = settings.DEBUG and not NewsletterSubscriber.objects.filter(email=email).exists()
+
+        subscriber = NewsletterSubscriber(email=email, is_active=True)
+        NewsletterSubscriber.objects.bulk_create(
+            [subscriber],
+            update_conflicts=True,
+            update_fields=['is_active'],
+            unique_fields=['email'],
+        )
+        if is_new:
+            subscriber_id = NewsletterSubscriber.objects.only('pk').get(email=email).pk
+            dispatch_after_commit(send_newsletter_welcome, subscriber_id)
+        return subscriber
 
 
 class FeedbackForm(forms.Form):
@@ -148,7 +168,8 @@ class FeedbackForm(forms.Form):
             'class': 'form-control',
             'placeholder': 'Your email (optional)'
         }),
-        required=False
+        required=False,
+        error_messages={'invalid': 'Please enter a valid email address.'}
     )
 
     feedback_type = forms.ChoiceField(
@@ -167,16 +188,6 @@ class FeedbackForm(forms.Form):
         max_length=1000
     )
 
-    def clean_email(self):
-        """Validate email if provided"""
-        email = self.cleaned_data.get('email')
-        if email:
-            try:
-                validate_email(email)
-            except ValidationError:
-                raise forms.ValidationError('Please enter a valid email address.')
-        return email
-
     def clean_message(self):
         """Validate feedback message"""
         message = self.cleaned_data.get('message', '').strip()
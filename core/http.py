@@ -0,0 +1,31 @@
+"""
+HTTP Helpers for Core App
+Contains response classes shared by the AJAX endpoints:
+- orjson-backed JSON responses
+"""
+
+from django.http import HttpResponse, JsonResponse
+
+# orjson serializes to bytes in C and is a drop-in win for the small
+# AJAX payloads; fall back to Django's JsonResponse where it is absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    class ORJSONResponse(HttpResponse):
+        """
+        JSON response serialized with orjson
+
+        Only accepts plain Python structures — pass form errors through
+        form.errors.get_json_data() rather than the ErrorDict itself
+        """
+
+        def __init__(self, data, **kwargs):
+            kwargs.setdefault('content_type', 'application/json')
+            super().__init__(orjson.dumps(data), **kwargs)
+else:
+    class ORJSONResponse(JsonResponse):
+        """Fallback to the stdlib encoder when orjson is not installed"""
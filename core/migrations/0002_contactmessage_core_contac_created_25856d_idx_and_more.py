@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-28 20:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at'], name='core_contac_created_25856d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_read', 'created_at'], name='core_contac_is_read_f17b60_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['subject'], name='core_contac_subject_25cab1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['category', 'is_active', 'order'], name='core_faq_categor_1779d9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newslettersubscriber',
+            index=models.Index(fields=['email', 'is_active'], name='core_newsle_email_f1540c_idx'),
+        ),
+    ]
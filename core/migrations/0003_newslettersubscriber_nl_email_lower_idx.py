@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-28 20:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_contactmessage_core_contac_created_25856d_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newslettersubscriber',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='nl_email_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,141 @@
+from django.db import migrations, models
+
+
+# Old string codes -> new integer codes
+SUBJECT_MAP = {
+    'general': 1,
+    'support': 2,
+    'artisan': 3,
+    'business': 4,
+    'feedback': 5,
+    'other': 6,
+}
+
+CLIENT_TYPE_MAP = {
+    'homeowner': 1,
+    'artisan': 2,
+}
+
+CATEGORY_MAP = {
+    'general': 1,
+    'homeowners': 2,
+    'artisans': 3,
+    'payments': 4,
+    'safety': 5,
+}
+
+
+def copy_codes_forward(apps, schema_editor):
+    """Populate the new integer columns from the old string codes"""
+    ContactMessage = apps.get_model('core', 'ContactMessage')
+    Testimonial = apps.get_model('core', 'Testimonial')
+    FAQ = apps.get_model('core', 'FAQ')
+
+    for old_code, new_code in SUBJECT_MAP.items():
+        ContactMessage.objects.filter(subject=old_code).update(subject_code=new_code)
+    for old_code, new_code in CLIENT_TYPE_MAP.items():
+        Testimonial.objects.filter(client_type=old_code).update(client_type_code=new_code)
+    for old_code, new_code in CATEGORY_MAP.items():
+        FAQ.objects.filter(category=old_code).update(category_code=new_code)
+
+
+def copy_codes_backward(apps, schema_editor):
+    """Restore the old string codes from the integer columns"""
+    ContactMessage = apps.get_model('core', 'ContactMessage')
+    Testimonial = apps.get_model('core', 'Testimonial')
+    FAQ = apps.get_model('core', 'FAQ')
+
+    for old_code, new_code in SUBJECT_MAP.items():
+        ContactMessage.objects.filter(subject_code=new_code).update(subject=old_code)
+    for old_code, new_code in CLIENT_TYPE_MAP.items():
+        Testimonial.objects.filter(client_type_code=new_code).update(client_type=old_code)
+    for old_code, new_code in CATEGORY_MAP.items():
+        FAQ.objects.filter(category_code=new_code).update(category=old_code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_newslettersubscriber_nl_email_lower_idx'),
+    ]
+
+    operations = [
+        # Drop indexes that cover the columns being replaced
+        migrations.RemoveIndex(
+            model_name='contactmessage',
+            name='core_contac_subject_25cab1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='faq',
+            name='core_faq_categor_1779d9_idx',
+        ),
+        # Add the integer columns alongside the old string ones
+        migrations.AddField(
+            model_name='contactmessage',
+            name='subject_code',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='client_type_code',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='faq',
+            name='category_code',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.RunPython(copy_codes_forward, copy_codes_backward),
+        # Swap the integer columns in for the string ones
+        migrations.RemoveField(
+            model_name='contactmessage',
+            name='subject',
+        ),
+        migrations.RemoveField(
+            model_name='testimonial',
+            name='client_type',
+        ),
+        migrations.RemoveField(
+            model_name='faq',
+            name='category',
+        ),
+        migrations.RenameField(
+            model_name='contactmessage',
+            old_name='subject_code',
+            new_name='subject',
+        ),
+        migrations.RenameField(
+            model_name='testimonial',
+            old_name='client_type_code',
+            new_name='client_type',
+        ),
+        migrations.RenameField(
+            model_name='faq',
+            old_name='category_code',
+            new_name='category',
+        ),
+        migrations.AlterField(
+            model_name='contactmessage',
+            name='subject',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'General Inquiry'), (2, 'Technical Support'), (3, 'Become an Artisan'), (4, 'Business Partnership'), (5, 'Feedback & Suggestions'), (6, 'Other')]),
+        ),
+        migrations.AlterField(
+            model_name='testimonial',
+            name='client_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Homeowner'), (2, 'Artisan')]),
+        ),
+        migrations.AlterField(
+            model_name='faq',
+            name='category',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'General'), (2, 'For Homeowners'), (3, 'For Artisans'), (4, 'Payments'), (5, 'Safety & Trust')]),
+        ),
+        # Recreate the indexes on the new fixed-width columns
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['subject'], name='core_contac_subject_25cab1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['category', 'is_active', 'order'], name='core_faq_categor_1779d9_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-28 20:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_integer_choice_fields'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='contactmessage',
+            options={'base_manager_name': 'objects', 'ordering': ['-created_at']},
+        ),
+        migrations.AlterModelOptions(
+            name='faq',
+            options={'base_manager_name': 'objects', 'ordering': ['order', 'question']},
+        ),
+        migrations.AlterModelOptions(
+            name='newslettersubscriber',
+            options={'base_manager_name': 'objects', 'ordering': ['-subscribed_at']},
+        ),
+        migrations.AlterModelOptions(
+            name='sitesetting',
+            options={'base_manager_name': 'objects', 'verbose_name': 'Site Setting', 'verbose_name_plural': 'Site Settings'},
+        ),
+        migrations.AlterModelOptions(
+            name='testimonial',
+            options={'base_manager_name': 'objects', 'ordering': ['-created_at']},
+        ),
+    ]
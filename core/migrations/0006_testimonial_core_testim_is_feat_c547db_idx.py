@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_alter_contactmessage_options_alter_faq_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['is_featured', '-created_at'], name='core_testim_is_feat_c547db_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 21:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_testimonial_core_testim_is_feat_c547db_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['is_active'], name='core_faq_is_acti_90717d_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 21:51
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_faq_core_faq_is_acti_90717d_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='newslettersubscriber',
+            name='nl_email_lower_idx',
+        ),
+    ]
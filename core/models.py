@@ -2,6 +2,23 @@ from django.db import models
 from django.contrib.auth.models import User
 
 
+class CoreManager(models.Manager):
+    """
+    Manager that applies select_related for any FK fields on the model,
+    so admin changelists stay at one query as relations are added
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fk_names = [
+            field.name for field in self.model._meta.concrete_fields
+            if field.is_relation
+        ]
+        if fk_names:
+            queryset = queryset.select_related(*fk_names)
+        return queryset
+
+
 class SiteSetting(models.Model):
     """Site-wide settings"""
     site_name = models.CharField(max_length=100, default='MjengoLink')
@@ -16,48 +33,60 @@ class SiteSetting(models.Model):
     newsletter_subscription = models.BooleanField(default=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CoreManager()
+
     def __str__(self):
         return "Site Settings"
 
     class Meta:
         verbose_name = "Site Setting"
         verbose_name_plural = "Site Settings"
+        base_manager_name = 'objects'
 
 
 class ContactMessage(models.Model):
     """Contact form submissions"""
+    # Small integer codes keep rows narrow and the subject index fixed-width
     SUBJECT_CHOICES = [
-        ('general', 'General Inquiry'),
-        ('support', 'Technical Support'),
-        ('artisan', 'Become an Artisan'),
-        ('business', 'Business Partnership'),
-        ('feedback', 'Feedback & Suggestions'),
-        ('other', 'Other'),
+        (1, 'General Inquiry'),
+        (2, 'Technical Support'),
+        (3, 'Become an Artisan'),
+        (4, 'Business Partnership'),
+        (5, 'Feedback & Suggestions'),
+        (6, 'Other'),
     ]
 
     name = models.CharField(max_length=100)
     email = models.EmailField()
     phone = models.CharField(max_length=20, blank=True)
-    subject = models.CharField(max_length=50, choices=SUBJECT_CHOICES)
+    subject = models.PositiveSmallIntegerField(choices=SUBJECT_CHOICES)
     message = models.TextField()
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = CoreManager()
+
     def __str__(self):
         return f"{self.name} - {self.get_subject_display()}"
 
     class Meta:
         ordering = ['-created_at']
+        base_manager_name = 'objects'
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['is_read', 'created_at']),
+            models.Index(fields=['subject']),
+        ]
 
 
 class Testimonial(models.Model):
     """Client testimonials for homepage"""
     client_name = models.CharField(max_length=100)
     client_location = models.CharField(max_length=100)
-    client_type = models.CharField(max_length=50, choices=[
-        ('homeowner', 'Homeowner'),
-        ('artisan', 'Artisan'),
+    client_type = models.PositiveSmallIntegerField(choices=[
+        (1, 'Homeowner'),
+        (2, 'Artisan'),
     ])
     content = models.TextField()
     rating = models.IntegerField(choices=[(i, i) for i in range(1, 6)])
@@ -65,34 +94,51 @@ class Testimonial(models.Model):
     is_featured = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = CoreManager()
+
     def __str__(self):
         return f"Testimonial by {self.client_name}"
 
     class Meta:
         ordering = ['-created_at']
+        base_manager_name = 'objects'
+        indexes = [
+            # Homepage featured-testimonial query: filter + default ordering
+            models.Index(fields=['is_featured', '-created_at']),
+        ]
+
 
 
 class FAQ(models.Model):
     """Frequently Asked Questions"""
     CATEGORY_CHOICES = [
-        ('general', 'General'),
-        ('homeowners', 'For Homeowners'),
-        ('artisans', 'For Artisans'),
-        ('payments', 'Payments'),
-        ('safety', 'Safety & Trust'),
+        (1, 'General'),
+        (2, 'For Homeowners'),
+        (3, 'For Artisans'),
+        (4, 'Payments'),
+        (5, 'Safety & Trust'),
     ]
 
     question = models.CharField(max_length=200)
     answer = models.TextField()
-    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
+    category = models.PositiveSmallIntegerField(choices=CATEGORY_CHOICES)
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
 
+    objects = CoreManager()
+
     def __str__(self):
         return self.question
 
     class Meta:
         ordering = ['order', 'question']
+        base_manager_name = 'objects'
+        indexes = [
+            models.Index(fields=['category', 'is_active', 'order']),
+            # Search filters on is_active alone, which the composite
+            # index above (category-led) cannot serve
+            models.Index(fields=['is_active']),
+        ]
 
 
 class NewsletterSubscriber(models.Model):
@@ -101,10 +147,27 @@ class NewsletterSubscriber(models.Model):
     subscribed_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
 
+    objects = CoreManager()
+
     def __str__(self):
         return self.email
 
+    @classmethod
+    def bulk_subscribe(cls, emails):
+        """
+        Subscribe many emails in batched multi-row INSERTs.
+        Duplicates are dropped server-side via the unique email index,
+        so imports don't need a per-row existence check.
+        """
+        subscribers = [cls(email=email.lower()) for email in emails]
+        return cls.objects.bulk_create(
+            subscribers, ignore_conflicts=True, batch_size=1000)
+
     class Meta:
         ordering = ['-subscribed_at']
+        base_manager_name = 'objects'
+        indexes = [
+            models.Index(fields=['email', 'is_active']),
+        ]
 
 
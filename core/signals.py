@@ -6,98 +6,94 @@ Contains signal receivers for:
 - Updating site statistics
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.core.cache import cache, caches
 
-from .models import ContactMessage, NewsletterSubscriber, SiteSetting
+from .models import FAQ, ContactMessage, NewsletterSubscriber, SiteSetting, Testimonial
+from .tasks import dispatch_after_commit, send_contact_emails, send_newsletter_welcome
+from .utils.helpers import FAQ_CACHE_KEYS, SITE_SETTINGS_CACHE_KEY
+
+# Module-level cache for the SiteSetting singleton so signal handlers
+# don't hit the database on every ContactMessage/NewsletterSubscriber save
+_site_settings_cache = None
+
+
+def get_cached_site_settings():
+    """
+    Return the cached SiteSetting instance, loading it once if needed
+    Only the fields used by the email handlers are fetched
+    """
+    global _site_settings_cache
+    if _site_settings_cache is None:
+        _site_settings_cache = SiteSetting.objects.only(
+            'site_name', 'contact_email', 'contact_phone'
+        ).first()
+    return _site_settings_cache
+
+
+@receiver(post_save, sender=SiteSetting)
+def refresh_site_settings_cache(sender, instance, **kwargs):
+    """Keep the cached SiteSetting fresh when it is edited in admin"""
+    global _site_settings_cache
+    _site_settings_cache = instance
+    cache.delete('sitesetting_exists')
+    cache.delete(SITE_SETTINGS_CACHE_KEY)
+
+
+@receiver(post_delete, sender=SiteSetting)
+def clear_site_settings_cache(sender, instance, **kwargs):
+    """Drop cached state if the settings row is ever removed"""
+    global _site_settings_cache
+    _site_settings_cache = None
+    cache.delete('sitesetting_exists')
+    cache.delete(SITE_SETTINGS_CACHE_KEY)
+
+
+@receiver(post_save, sender=FAQ)
+@receiver(post_delete, sender=FAQ)
+@receiver(post_save, sender=Testimonial)
+@receiver(post_delete, sender=Testimonial)
+@receiver(post_save, sender=SiteSetting)
+@receiver(post_delete, sender=SiteSetting)
+def invalidate_page_cache(sender, **kwargs):
+    """
+    Flush the cached static pages when the content they render changes
+    The 'pages' cache only holds cache_page output (see core/urls.py),
+    so clearing it wholesale is safe and simpler than tracking keys
+    """
+    caches['pages'].clear()
+
+
+@receiver(post_save, sender=FAQ)
+@receiver(post_delete, sender=FAQ)
+def clear_faq_caches(sender, **kwargs):
+    """Drop the cached FAQ lookups whenever an FAQ row changes"""
+    cache.delete_many(FAQ_CACHE_KEYS)
 
 
-@receiver(post_save, sender=ContactMessage)
 def send_contact_confirmation_email(sender, instance, created, **kwargs):
     """
-    Send confirmation email when contact form is submitted
+    Queue confirmation + admin emails when contact form is submitted
     """
-    if created and settings.DEBUG:  # Only in development for now
-        try:
-            site_settings = SiteSetting.objects.first()
-            if site_settings:
-                subject = f"Thank you for contacting {site_settings.site_name}"
-
-                # Render HTML email template
-                html_message = render_to_string('emails/contact_confirmation.html', {
-                    'name': instance.name,
-                    'subject': instance.subject,
-                    'message': instance.message,
-                    'site_name': site_settings.site_name,
-                    'contact_email': site_settings.contact_email,
-                    'contact_phone': site_settings.contact_phone,
-                })
-
-                plain_message = strip_tags(html_message)
-
-                send_mail(
-                    subject=subject,
-                    message=plain_message,
-                    from_email=site_settings.contact_email,
-                    recipient_list=[instance.email],
-                    html_message=html_message,
-                    fail_silently=True,
-                )
-
-                # Also send notification to admin
-                admin_subject = f"New Contact Form Submission: {instance.subject}"
-                admin_html = render_to_string('emails/contact_admin_notification.html', {
-                    'contact': instance,
-                    'site_name': site_settings.site_name,
-                })
-                admin_plain = strip_tags(admin_html)
-
-                send_mail(
-                    subject=admin_subject,
-                    message=admin_plain,
-                    from_email=site_settings.contact_email,
-                    recipient_list=[site_settings.contact_email],
-                    html_message=admin_html,
-                    fail_silently=True,
-                )
-        except Exception as e:
-            # Log error but don't break the application
-            print(f"Error sending contact confirmation email: {e}")
-
-
-@receiver(post_save, sender=NewsletterSubscriber)
+    if created:
+        dispatch_after_commit(send_contact_emails, instance.pk)
+
+
 def send_welcome_newsletter_email(sender, instance, created, **kwargs):
     """
-    Send welcome email when someone subscribes to newsletter
+    Queue welcome email when someone subscribes to newsletter
     """
-    if created and settings.DEBUG:  # Only in development for now
-        try:
-            site_settings = SiteSetting.objects.first()
-            if site_settings and instance.is_active:
-                subject = f"Welcome to {site_settings.site_name} Newsletter!"
-
-                html_message = render_to_string('emails/newsletter_welcome.html', {
-                    'email': instance.email,
-                    'site_name': site_settings.site_name,
-                    'unsubscribe_url': '#',  # Would be actual URL in production
-                })
-
-                plain_message = strip_tags(html_message)
-
-                send_mail(
-                    subject=subject,
-                    message=plain_message,
-                    from_email=site_settings.contact_email,
-                    recipient_list=[instance.email],
-                    html_message=html_message,
-                    fail_silently=True,
-                )
-        except Exception as e:
-            print(f"Error sending welcome newsletter email: {e}")
+    if created:
+        dispatch_after_commit(send_newsletter_welcome, instance.pk)
+
+
+# Email handlers only run in development for now — skip connecting them
+# entirely in production so the signal dispatch costs nothing there
+if settings.DEBUG:
+    receiver(post_save, sender=ContactMessage)(send_contact_confirmation_email)
+    receiver(post_save, sender=NewsletterSubscriber)(send_welcome_newsletter_email)
 
 
 @receiver(post_save, sender=ContactMessage)
@@ -6,22 +6,24 @@ Defines XML sitemaps for SEO optimization:
 - SEO metadata for pages
 """
 
+from datetime import datetime
+
 from django.contrib.sitemaps import Sitemap
 from django.urls import reverse
 
+# Static pages only change on deploy, so freeze lastmod at process start —
+# a stable value lets CDNs and crawlers cache the sitemap
+_STATIC_PAGES_LASTMOD = datetime.now()
 
-class StaticViewSitemap(Sitemap):
-    """
-    Sitemap for static pages
-    Defines priority, changefreq, and lastmod for static pages
-    """
+# Pre-reversed URLs for the static pages, computed once on first fetch
+_static_urls = None
 
-    changefreq = "weekly"
-    priority = 0.8
 
-    def items(self):
-        """List of static page URLs"""
-        return [
+def _get_static_urls():
+    """Reverse the static page URL names once and reuse the tuple"""
+    global _static_urls
+    if _static_urls is None:
+        _static_urls = tuple(reverse(name) for name in (
             'core:home',
             'core:about',
             'core:services',
@@ -32,16 +34,30 @@ class StaticViewSitemap(Sitemap):
             'core:safety',
             'core:help-center',
             'core:faq',
-        ]
+        ))
+    return _static_urls
+
+
+class StaticViewSitemap(Sitemap):
+    """
+    Sitemap for static pages
+    Defines priority, changefreq, and lastmod for static pages
+    """
+
+    changefreq = "weekly"
+    priority = 0.8
+
+    def items(self):
+        """List of static page URLs (already reversed)"""
+        return _get_static_urls()
 
     def location(self, item):
-        """Get URL for each item"""
-        return reverse(item)
+        """Items are pre-reversed URLs"""
+        return item
 
     def lastmod(self, item):
         """Last modification date (static pages don't change often)"""
-        from datetime import datetime
-        return datetime.now()
+        return _STATIC_PAGES_LASTMOD
 
 
 class DynamicContentSitemap(Sitemap):
@@ -0,0 +1,130 @@
+"""
+Background Tasks for Core App
+Contains deferred work dispatched from signal handlers:
+- Contact confirmation + admin notification emails
+- Newsletter welcome emails
+
+Tasks run on a plain background thread after the transaction commits so
+the HTTP response is not blocked on SMTP. If a task queue (Celery/RQ) is
+adopted later, these functions become the task bodies unchanged.
+"""
+
+import threading
+
+from django.core.mail import get_connection, EmailMultiAlternatives
+from django.db import transaction
+from django.template.loader import get_template
+
+# Parsed Template objects, keyed by template name, so repeated sends
+# skip the template-loader lookup entirely
+_template_cache = {}
+
+
+def render_cached_template(template_name, context):
+    """Render an email template, caching the parsed Template object"""
+    template = _template_cache.get(template_name)
+    if template is None:
+        template = _template_cache[template_name] = get_template(template_name)
+    return template.render(context)
+
+
+def dispatch_after_commit(func, *args):
+    """
+    Run func(*args) on a background thread once the current
+    transaction has committed
+    """
+    transaction.on_commit(
+        lambda: threading.Thread(target=func, args=args, daemon=True).start()
+    )
+
+
+def send_contact_emails(contact_id):
+    """
+    Send the confirmation email to the submitter and the notification
+    email to the site admin for a saved ContactMessage
+    """
+    from .models import ContactMessage
+    from .signals import get_cached_site_settings
+
+    try:
+        contact = ContactMessage.objects.get(pk=contact_id)
+        site_settings = get_cached_site_settings()
+        if not site_settings:
+            return
+
+        subject = f"Thank you for contacting {site_settings.site_name}"
+        context = {
+            'name': contact.name,
+            'subject': contact.get_subject_display(),
+            'message': contact.message,
+            'site_name': site_settings.site_name,
+            'contact_email': site_settings.contact_email,
+            'contact_phone': site_settings.contact_phone,
+        }
+        html_message = render_cached_template('emails/contact_confirmation.html', context)
+        plain_message = render_cached_template('emails/contact_confirmation.txt', context)
+
+        user_msg = EmailMultiAlternatives(
+            subject=subject,
+            body=plain_message,
+            from_email=site_settings.contact_email,
+            to=[contact.email],
+        )
+        user_msg.attach_alternative(html_message, 'text/html')
+
+        admin_subject = f"New Contact Form Submission: {contact.get_subject_display()}"
+        admin_context = {
+            'contact': contact,
+            'site_name': site_settings.site_name,
+        }
+        admin_html = render_cached_template('emails/contact_admin_notification.html', admin_context)
+        admin_plain = render_cached_template('emails/contact_admin_notification.txt', admin_context)
+
+        admin_msg = EmailMultiAlternatives(
+            subject=admin_subject,
+            body=admin_plain,
+            from_email=site_settings.contact_email,
+            to=[site_settings.contact_email],
+        )
+        admin_msg.attach_alternative(admin_html, 'text/html')
+
+        # Send both messages over a single SMTP connection
+        with get_connection(fail_silently=True) as connection:
+            connection.send_messages([user_msg, admin_msg])
+    except Exception as e:
+        # Log error but don't break the application
+        print(f"Error sending contact confirmation email: {e}")
+
+
+def send_newsletter_welcome(subscriber_id):
+    """Send the welcome email for a new newsletter subscriber"""
+    from .models import NewsletterSubscriber
+    from .signals import get_cached_site_settings
+
+    try:
+        subscriber = NewsletterSubscriber.objects.get(pk=subscriber_id)
+        site_settings = get_cached_site_settings()
+        if not (site_settings and subscriber.is_active):
+            return
+
+        subject = f"Welcome to {site_settings.site_name} Newsletter!"
+        context = {
+            'email': subscriber.email,
+            'site_name': site_settings.site_name,
+            'unsubscribe_url': '#',  # Would be actual URL in production
+        }
+        html_message = render_cached_template('emails/newsletter_welcome.html', context)
+        plain_message = render_cached_template('emails/newsletter_welcome.txt', context)
+
+        msg = EmailMultiAlternatives(
+            subject=subject,
+            body=plain_message,
+            from_email=site_settings.contact_email,
+            to=[subscriber.email],
+        )
+        msg.attach_alternative(html_message, 'text/html')
+
+        with get_connection(fail_silently=True) as connection:
+            connection.send_messages([msg])
+    except Exception as e:
+        print(f"Error sending welcome newsletter email: {e}")
@@ -13,15 +13,17 @@ from django.urls import reverse
 from django.contrib.auth.models import User
 from django.core import mail
 
+from . import tasks
 from .models import SiteSetting, ContactMessage, Testimonial, FAQ, NewsletterSubscriber
 
 
 class SiteSettingModelTest(TestCase):
     """Test cases for SiteSetting model"""
 
-    def setUp(self):
-        """Create test data"""
-        self.site_settings = SiteSetting.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class"""
+        cls.site_settings = SiteSetting.objects.create(
             site_name="Test Site",
             tagline="Test Tagline",
             contact_email="test@example.com",
@@ -51,19 +53,20 @@ class SiteSettingModelTest(TestCase):
 class ContactMessageModelTest(TestCase):
     """Test cases for ContactMessage model"""
 
-    def setUp(self):
-        """Create test data"""
-        self.contact = ContactMessage.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class"""
+        cls.contact = ContactMessage.objects.create(
             name="John Doe",
             email="john@example.com",
-            subject="general",
+            subject=1,
             message="Test message"
         )
 
     def test_contact_message_creation(self):
         """Test contact message creation"""
         self.assertEqual(self.contact.name, "John Doe")
-        self.assertEqual(self.contact.subject, "general")
+        self.assertEqual(self.contact.subject, 1)
         self.assertFalse(self.contact.is_read)
 
     def test_contact_message_str(self):
@@ -76,7 +79,7 @@ class ContactMessageModelTest(TestCase):
         ContactMessage.objects.create(
             name="Jane Doe",
             email="jane@example.com",
-            subject="support",
+            subject=2,
             message="Another message"
         )
 
@@ -88,12 +91,13 @@ class ContactMessageModelTest(TestCase):
 class TestimonialModelTest(TestCase):
     """Test cases for Testimonial model"""
 
-    def setUp(self):
-        """Create test data"""
-        self.testimonial = Testimonial.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class"""
+        cls.testimonial = Testimonial.objects.create(
             client_name="John Kamau",
             client_location="Nairobi",
-            client_type="homeowner",
+            client_type=1,
             content="Great service!",
             rating=5
         )
@@ -112,12 +116,13 @@ class TestimonialModelTest(TestCase):
 class FAQModelTest(TestCase):
     """Test cases for FAQ model"""
 
-    def setUp(self):
-        """Create test data"""
-        self.faq = FAQ.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class"""
+        cls.faq = FAQ.objects.create(
             question="What is MjengoLink?",
             answer="A construction platform",
-            category="general",
+            category=1,
             order=1
         )
 
@@ -134,9 +139,10 @@ class FAQModelTest(TestCase):
 class NewsletterSubscriberModelTest(TestCase):
     """Test cases for NewsletterSubscriber model"""
 
-    def setUp(self):
-        """Create test data"""
-        self.subscriber = NewsletterSubscriber.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class"""
+        cls.subscriber = NewsletterSubscriber.objects.create(
             email="subscriber@example.com"
         )
 
@@ -160,54 +166,58 @@ class NewsletterSubscriberModelTest(TestCase):
 class ViewTests(TestCase):
     """Test cases for views"""
 
-    def setUp(self):
-        """Set up test client and data"""
-        self.client = Client()
-        self.site_settings = SiteSetting.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once for the class"""
+        cls.site_settings = SiteSetting.objects.create(
             site_name="Test Site",
             contact_email="test@example.com"
         )
-        self.faq = FAQ.objects.create(
+        cls.faq = FAQ.objects.create(
             question="Test Question",
             answer="Test Answer",
-            category="general"
+            category=1
         )
-        self.testimonial = Testimonial.objects.create(
+        cls.testimonial = Testimonial.objects.create(
             client_name="Test Client",
             client_location="Test Location",
-            client_type="homeowner",
+            client_type=1,
             content="Test content",
             rating=5
         )
 
+    def setUp(self):
+        """Set up test client (client state is per-test)"""
+        self.client = Client()
+
     def test_homepage_view(self):
         """Test homepage loads successfully"""
-        response = self.client.get(reverse('home'))
+        response = self.client.get(reverse('core:home'))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'core/home.html')
 
     def test_about_view(self):
         """Test about page loads successfully"""
-        response = self.client.get(reverse('about'))
+        response = self.client.get(reverse('core:about'))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'core/about.html')
 
     def test_services_view(self):
         """Test services page loads successfully"""
-        response = self.client.get(reverse('services'))
+        response = self.client.get(reverse('core:services'))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'core/services.html')
 
     def test_contact_view(self):
         """Test contact page loads successfully"""
-        response = self.client.get(reverse('contact'))
+        response = self.client.get(reverse('core:contact'))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'core/contact.html')
         self.assertContains(response, 'Contact Us')
 
     def test_how_it_works_view(self):
         """Test how-it-works page loads successfully"""
-        response = self.client.get(reverse('how-it-works'))
+        response = self.client.get(reverse('core:how-it-works'))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'core/how-it-works.html')
 
@@ -216,12 +226,12 @@ class ViewTests(TestCase):
         data = {
             'name': 'Test User',
             'email': 'test@example.com',
-            'subject': 'general',
+            'subject': '1',
             'message': 'Test message',
             'consent': 'on'
         }
 
-        response = self.client.post(reverse('contact'), data)
+        response = self.client.post(reverse('core:contact'), data)
 
         # Should redirect or show success message
         self.assertIn(response.status_code, [200, 302])
@@ -233,39 +243,43 @@ class ViewTests(TestCase):
 class AdminTests(TestCase):
     """Test cases for admin interfaces"""
 
-    def setUp(self):
-        """Create admin user and login"""
-        self.admin_user = User.objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the admin user and fixtures once for the class"""
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@example.com',
             password='adminpass'
         )
-        self.client = Client()
-        self.client.login(username='admin', password='adminpass')
 
         # Create test data
-        self.contact = ContactMessage.objects.create(
+        cls.contact = ContactMessage.objects.create(
             name="Test User",
             email="test@example.com",
-            subject="general",
+            subject=1,
             message="Test"
         )
-        self.testimonial = Testimonial.objects.create(
+        cls.testimonial = Testimonial.objects.create(
             client_name="Test Client",
             client_location="Test",
-            client_type="homeowner",
+            client_type=1,
             content="Test",
             rating=5
         )
-        self.faq = FAQ.objects.create(
+        cls.faq = FAQ.objects.create(
             question="Test",
             answer="Test",
-            category="general"
+            category=1
         )
-        self.subscriber = NewsletterSubscriber.objects.create(
+        cls.subscriber = NewsletterSubscriber.objects.create(
             email="test@example.com"
         )
 
+    def setUp(self):
+        """Log in the per-test client"""
+        self.client = Client()
+        self.client.login(username='admin', password='adminpass')
+
     def test_admin_site_setting_list(self):
         """Test site setting admin list view"""
         response = self.client.get('/admin/core/sitesetting/')
@@ -308,42 +322,68 @@ class AdminTests(TestCase):
 class SignalTests(TestCase):
     """Test cases for signal handlers"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.site_settings = SiteSetting.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class"""
+        cls.site_settings = SiteSetting.objects.create(
             site_name="Test Site",
             contact_email="admin@example.com"
         )
 
     def test_contact_message_signal(self):
-        """Test that contact message triggers email signal"""
+        """Test that creating a contact message sends nothing in test mode"""
         # Clear any existing emails
         mail.outbox = []
 
-        # Create a contact message
+        # Create a contact message — the email receivers are only
+        # connected when DEBUG is on, so nothing should be queued here
         ContactMessage.objects.create(
             name="Test User",
             email="user@example.com",
-            subject="general",
+            subject=1,
+            message="Test message"
+        )
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_contact_emails_task(self):
+        """Test that the contact email task sends user + admin messages"""
+        contact = ContactMessage.objects.create(
+            name="Test User",
+            email="user@example.com",
+            subject=1,
             message="Test message"
         )
+        mail.outbox = []
+
+        tasks.send_contact_emails(contact.pk)
 
-        # Check if email would be sent (in development, it only prints)
-        # In production with proper email settings, we'd check mail.outbox
-        self.assertEqual(len(mail.outbox), 0)  # No actual email sent in test mode
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn("user@example.com", mail.outbox[0].to)
 
     def test_newsletter_subscriber_signal(self):
-        """Test that newsletter subscription triggers welcome email"""
+        """Test that subscribing sends nothing in test mode"""
         # Clear any existing emails
         mail.outbox = []
 
-        # Create a newsletter subscriber
+        # Create a newsletter subscriber — receivers are DEBUG-gated
         NewsletterSubscriber.objects.create(
             email="subscriber@example.com"
         )
 
-        # Check if email would be sent
-        self.assertEqual(len(mail.outbox), 0)  # No actual email sent in test mode
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_newsletter_welcome_task(self):
+        """Test that the welcome email task sends one message"""
+        subscriber = NewsletterSubscriber.objects.create(
+            email="subscriber@example.com"
+        )
+        mail.outbox = []
+
+        tasks.send_newsletter_welcome(subscriber.pk)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("subscriber@example.com", mail.outbox[0].to)
 
 
 class FormTests(TestCase):
@@ -8,7 +8,8 @@ Defines URL patterns for:
 """
 
 from django.urls import path
-from django.contrib.sitemaps.views import sitemap
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from django.views.generic import TemplateView
 
 from . import views
@@ -16,24 +17,40 @@ from . import views
 
 app_name = 'core'
 
+
+def _cached(view):
+    """
+    Cache a mostly-static page for 15 minutes in the 'pages' cache
+    Signal handlers in core/signals.py clear that cache when FAQ,
+    Testimonial or SiteSetting content changes
+
+    Vary: Cookie keeps sessions apart, so a page rendered for one
+    visitor (e.g. with their flash messages in the navbar) is never
+    served to another
+    """
+    # vary_on_headers is applied innermost so the Vary header is on the
+    # response before cache_page derives the cache key from it
+    return cache_page(60 * 15, cache='pages')(vary_on_headers('Cookie')(view))
+
+
 # sitemaps = {
 #     'static': StaticViewSitemap,
 # }
 
 urlpatterns = [
     # Public Pages
-    path('', views.HomeView.as_view(), name='home'),
-    path('about/', views.AboutView.as_view(), name='about'),
-    path('services/', views.ServicesView.as_view(), name='services'),
+    path('', _cached(views.HomeView.as_view()), name='home'),
+    path('about/', _cached(views.about), name='about'),
+    path('services/', _cached(views.ServicesView.as_view()), name='services'),
     path('contact/', views.ContactView.as_view(), name='contact'),
-    path('how-it-works/', views.HowItWorksView.as_view(), name='how-it-works'),
+    path('how-it-works/', _cached(views.how_it_works), name='how-it-works'),
 
     # Information Pages
-    path('privacy-policy/', views.PrivacyPolicyView.as_view(), name='privacy-policy'),
-    path('terms-of-service/', views.TermsOfServiceView.as_view(), name='terms'),
-    path('safety-trust/', views.SafetyTrustView.as_view(), name='safety'),
-    path('help-center/', views.HelpCenterView.as_view(), name='help-center'),
-    path('faq/', views.FAQView.as_view(), name='faq'),
+    path('privacy-policy/', _cached(views.privacy_policy), name='privacy-policy'),
+    path('terms-of-service/', _cached(views.terms_of_service), name='terms'),
+    path('safety-trust/', _cached(views.safety_trust), name='safety'),
+    path('help-center/', _cached(views.HelpCenterView.as_view()), name='help-center'),
+    path('faq/', _cached(views.FAQView.as_view()), name='faq'),
 
     # Form Processing
     path('contact/submit/', views.ContactSubmitView.as_view(), name='contact_submit'),
@@ -42,19 +59,25 @@ urlpatterns = [
          name='newsletter_unsubscribe'),
 
 
-    # Legal & Compliance
-    path('cancellation-policy/', TemplateView.as_view(template_name='core/cancellation_policy.html'),
+    # Legal & Compliance — static content, cached for a day so repeat
+    # requests skip template rendering (serve from the web server in
+    # production for a full bypass of the Django stack)
+    path('cancellation-policy/',
+         cache_page(86400)(TemplateView.as_view(template_name='core/cancellation_policy.html')),
          name='cancellation-policy'),
-    path('refund-policy/', TemplateView.as_view(template_name='core/refund_policy.html'), name='refund-policy'),
+    path('refund-policy/',
+         cache_page(86400)(TemplateView.as_view(template_name='core/refund_policy.html')),
+         name='refund-policy'),
 
     # Sitemap & SEO
     # path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
-    path('robots.txt', TemplateView.as_view(template_name='core/robots.txt', content_type='text/plain'),
+    path('robots.txt',
+         cache_page(86400)(TemplateView.as_view(template_name='core/robots.txt', content_type='text/plain')),
          name='robots.txt'),
 
     # Error Pages (custom handlers)
-    path('error/404/', views.Error404View.as_view(), name='error_404'),
-    path('error/500/', views.Error500View.as_view(), name='error_500'),
+    path('error/404/', _cached(views.error_404), name='error_404'),
+    path('error/500/', _cached(views.error_500), name='error_500'),
 
     # Search
     path('search/', views.SearchView.as_view(), name='search'),
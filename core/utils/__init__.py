@@ -10,12 +10,13 @@ Contains reusable utility modules for:
 # Make modules available at package level
 from .security import *
 from .validators import *
-from .mpesa_utils import *
+from .mpesa_utilis import *
+from .helpers import get_site_settings
 
 __all__ = [
     'generate_secure_token',
     'validate_phone_number',
-    'format_currency',
     'send_mpesa_stk_push',
+    'get_site_settings',
     # Add other exports as needed
 ]
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Common Helper Functions for Core App
+Contains shared helpers used across views and context processors:
+- Cached SiteSetting access
+- Cached FAQ lookups shared by the public pages
+"""
+
+from itertools import groupby
+from operator import itemgetter
+
+from django.core.cache import cache
+
+SITE_SETTINGS_CACHE_KEY = 'site_settings'
+SITE_SETTINGS_TTL = 300
+
+# FAQ content is near-static, so the querysets the public pages repeat
+# on every render are cached for an hour; core/signals.py drops these
+# keys whenever an FAQ row changes
+FAQ_CACHE_TTL = 3600
+FAQ_CACHE_KEYS = ('faq:categories', 'faq:contact', 'faq:active', 'faq:by_category')
+
+# General, Payments and Safety & Trust — the categories the contact
+# page surfaces (FAQ.CATEGORY_CHOICES codes)
+CONTACT_FAQ_CATEGORIES = (1, 4, 5)
+
+
+def get_site_settings():
+    """
+    Return the SiteSetting singleton, served from cache
+
+    Every public page puts site settings in its context, so this saves
+    one SQL round-trip per request. The post_save/post_delete signal
+    handlers in core/signals.py drop the key whenever the row changes.
+
+    Returns:
+        SiteSetting or None: The settings row, if one exists
+    """
+    # Imported here so the utils package can load before the app registry
+    from core.models import SiteSetting
+
+    return cache.get_or_set(SITE_SETTINGS_CACHE_KEY, SiteSetting.objects.first, SITE_SETTINGS_TTL)
+
+
+def get_faq_categories():
+    """
+    Return the distinct categories of active FAQs, cached
+
+    Returns:
+        list: Category codes in use
+    """
+    from core.models import FAQ
+
+    return cache.get_or_set(
+        'faq:categories',
+        lambda: list(FAQ.objects.filter(is_active=True).values_list('category', flat=True).distinct()),
+        FAQ_CACHE_TTL,
+    )
+
+
+def get_contact_faqs():
+    """
+    Return the FAQs shown on the contact page, cached
+    (General, Payments and Safety & Trust categories)
+
+    Returns:
+        list: Up to 5 FAQ instances
+    """
+    from core.models import FAQ
+
+    return cache.get_or_set(
+        'faq:contact',
+        lambda: list(FAQ.objects.filter(is_active=True, category__in=CONTACT_FAQ_CATEGORIES).only(
+            'question', 'answer', 'category'
+        )[:5]),
+        FAQ_CACHE_TTL,
+    )
+
+
+def get_active_faqs():
+    """
+    Return all active FAQs in display order, cached
+
+    Rows come back as dicts via values() — templates read the same keys,
+    and skipping model instantiation keeps the per-row cost to one dict
+
+    Returns:
+        list: Dicts with id, category, question, answer and order
+    """
+    from core.models import FAQ
+
+    return cache.get_or_set(
+        'faq:active',
+        lambda: list(FAQ.objects.filter(is_active=True).order_by('category', 'order').values(
+            'id', 'category', 'question', 'answer', 'order'
+        )),
+        FAQ_CACHE_TTL,
+    )
+
+
+def get_faqs_by_category():
+    """
+    Return active FAQs grouped by category display name, cached
+
+    Caching the grouped dict means the Python grouping loop runs once
+    per TTL rather than on every FAQ-page render; the display names come
+    from one choices map instead of a get_category_display() call per row
+
+    Returns:
+        dict: Category display name -> list of FAQ row dicts
+    """
+    from core.models import FAQ
+
+    def _group():
+        # Rows are already ordered by category, so groupby streams them
+        # without any per-row dict membership checks
+        display = dict(FAQ._meta.get_field('category').choices)
+        return {
+            display[category]: list(rows)
+            for category, rows in groupby(get_active_faqs(), key=itemgetter('category'))
+        }
+
+    return cache.get_or_set('faq:by_category', _group, FAQ_CACHE_TTL)
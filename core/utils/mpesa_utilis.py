@@ -8,13 +8,21 @@ Contains functions for M-Pesa API integration:
 Note: This is a simulation for development. In production, you'd use actual Daraja API.
 """
 
-import hashlib
 import base64
-import datetime
+import itertools
+import re
+import secrets
+import time
 from django.conf import settings
 import requests
-import json
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter, Retry
+
+# Strips everything except digits from phone numbers
+_NON_DIGITS_RE = re.compile(r'\D')
+
+# Deterministic rotation of simulated statuses — reproducible in tests,
+# no global RNG involved
+_DEV_STATUS_CYCLE = itertools.cycle(('Pending', 'Completed', 'Failed', 'Cancelled'))
 
 
 class MpesaGateway:
@@ -34,33 +42,66 @@ class MpesaGateway:
         else:
             self.base_url = 'https://sandbox.safaricom.co.ke'
 
+        # Pooled HTTP session so repeated API calls reuse the TCP/TLS
+        # connection to Safaricom instead of handshaking every time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount('https://', adapter)
+
+        # The Basic auth header never changes for a given credential pair,
+        # so encode it once instead of per token refresh
+        if self.consumer_key and self.consumer_secret:
+            auth_string = f"{self.consumer_key}:{self.consumer_secret}"
+            self._basic_auth = 'Basic ' + base64.b64encode(auth_string.encode()).decode()
+        else:
+            self._basic_auth = ''
+
+        # OAuth token memoized until shortly before Daraja expires it
+        self._cached_token = ''
+        self._token_expiry = 0.0
+
+        # Shortcode+passkey never change per gateway — encode them once so
+        # generate_password only has to encode the timestamp
+        self._password_prefix = f"{self.business_shortcode}{self.passkey}".encode()
+
     def generate_access_token(self):
         """
         Generate OAuth access token for M-Pesa API
 
+        Daraja tokens live ~3599s, so the token is cached in-process and
+        refreshed a minute early rather than fetched per STK push
+
         Returns:
             str: Access token or empty string if failed
         """
         try:
-            if not self.consumer_key or not self.consumer_secret:
+            if not self._basic_auth:
                 return ''
 
-            # Encode consumer key and secret
-            auth_string = f"{self.consumer_key}:{self.consumer_secret}"
-            encoded_auth = base64.b64encode(auth_string.encode()).decode()
+            now = time.monotonic()
+            if self._cached_token and now < self._token_expiry:
+                return self._cached_token
 
             # Make request
             url = f"{self.base_url}/oauth/v1/generate?grant_type=client_credentials"
             headers = {
-                'Authorization': f'Basic {encoded_auth}',
+                'Authorization': self._basic_auth,
                 'Content-Type': 'application/json'
             }
 
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
-                return data.get('access_token', '')
+                token = data.get('access_token', '')
+                if token:
+                    self._cached_token = token
+                    self._token_expiry = now + int(data.get('expires_in', 3500)) - 60
+                return token
             else:
                 print(f"MPesa token error: {response.status_code} - {response.text}")
                 return ''
@@ -79,9 +120,7 @@ class MpesaGateway:
         Returns:
             str: Base64 encoded password
         """
-        data_to_encode = f"{self.business_shortcode}{self.passkey}{timestamp}"
-        encoded = base64.b64encode(data_to_encode.encode()).decode()
-        return encoded
+        return base64.b64encode(self._password_prefix + timestamp.encode('ascii')).decode('ascii')
 
     def simulate_stk_push(self, phone_number, amount, account_reference, transaction_desc):
         """
@@ -96,8 +135,8 @@ class MpesaGateway:
         Returns:
             dict: Simulated response with checkout request ID
         """
-        # Generate timestamp
-        timestamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
+        # Generate timestamp (time.strftime skips the datetime allocation)
+        timestamp = time.strftime('%Y%m%d%H%M%S')
 
         # Generate password
         password = self.generate_password(timestamp)
@@ -146,9 +185,7 @@ class MpesaGateway:
         # In development, simulate status check
         if settings.DEBUG:
             # Simulate different statuses
-            import random
-            statuses = ['Pending', 'Completed', 'Failed', 'Cancelled']
-            status = random.choice(statuses)
+            status = next(_DEV_STATUS_CYCLE)
 
             return {
                 'success': True,
@@ -176,20 +213,17 @@ class MpesaGateway:
         Returns:
             tuple: (is_valid, validated_data, error_message)
         """
-        required_fields = ['Body', 'stkCallback']
-
         if not isinstance(callback_data, dict):
             return False, None, 'Callback data must be a dictionary'
 
-        # Check for required fields
-        for field in required_fields:
-            if field not in callback_data:
-                return False, None, f'Missing required field: {field}'
-
+        # EAFP: attempt the nested access directly — the old per-field loop
+        # checked 'stkCallback' at the wrong level anyway
         try:
-            # Extract relevant data
             stk_callback = callback_data['Body']['stkCallback']
+        except (KeyError, TypeError):
+            return False, None, 'Missing required field: Body.stkCallback'
 
+        try:
             validated = {
                 'merchant_request_id': stk_callback.get('MerchantRequestID', ''),
                 'checkout_request_id': stk_callback.get('CheckoutRequestID', ''),
@@ -198,17 +232,14 @@ class MpesaGateway:
                 'callback_metadata': stk_callback.get('CallbackMetadata', {}),
             }
 
-            # Extract transaction details from metadata
+            # Extract transaction details from metadata in one pass
+            # (duplicate names last-win, matching the old overwrite behaviour)
             metadata = validated['callback_metadata'].get('Item', [])
-            for item in metadata:
-                if item.get('Name') == 'Amount':
-                    validated['amount'] = item.get('Value', 0)
-                elif item.get('Name') == 'MpesaReceiptNumber':
-                    validated['mpesa_receipt'] = item.get('Value', '')
-                elif item.get('Name') == 'TransactionDate':
-                    validated['transaction_date'] = item.get('Value', '')
-                elif item.get('Name') == 'PhoneNumber':
-                    validated['phone_number'] = item.get('Value', '')
+            items = {item.get('Name'): item.get('Value') for item in metadata if 'Name' in item}
+            validated['amount'] = items.get('Amount', 0)
+            validated['mpesa_receipt'] = items.get('MpesaReceiptNumber', '')
+            validated['transaction_date'] = items.get('TransactionDate', '')
+            validated['phone_number'] = items.get('PhoneNumber', '')
 
             return True, validated, None
 
@@ -216,6 +247,18 @@ class MpesaGateway:
             return False, None, f'Error parsing callback data: {str(e)}'
 
 
+# Shared gateway instance so callers reuse one pooled HTTP session
+_gateway = None
+
+
+def get_mpesa_gateway():
+    """Return the shared MpesaGateway instance, creating it on first use"""
+    global _gateway
+    if _gateway is None:
+        _gateway = MpesaGateway()
+    return _gateway
+
+
 def send_mpesa_stk_push(phone, amount, reference, description):
     """
     Convenience function to send STK Push
@@ -229,8 +272,7 @@ def send_mpesa_stk_push(phone, amount, reference, description):
     Returns:
         dict: Response from MPesa gateway
     """
-    gateway = MpesaGateway()
-    return gateway.simulate_stk_push(phone, amount, reference, description)
+    return get_mpesa_gateway().simulate_stk_push(phone, amount, reference, description)
 
 
 def format_phone_for_mpesa(phone_number):
@@ -243,27 +285,26 @@ def format_phone_for_mpesa(phone_number):
     Returns:
         str: Formatted phone number or None if invalid
     """
-    import re
-
     # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone_number)
+    digits = _NON_DIGITS_RE.sub('', phone_number)
 
     # Check length
-    if len(digits) < 9 or len(digits) > 12:
+    n = len(digits)
+    if not 9 <= n <= 12:
         return None
 
-    # Format to 254 format
-    if digits.startswith('0'):
+    # Format to 254 format — dispatch on the first character before the
+    # rarer prefix check, ordered by how numbers are usually entered
+    if digits[0] == '0':
         # Convert 07... to 2547...
         return '254' + digits[1:]
-    elif digits.startswith('254'):
+    if digits.startswith('254'):
         # Already in correct format
         return digits
-    elif len(digits) == 9:
+    if n == 9:
         # Assume it's missing 254 prefix
         return '254' + digits
-    else:
-        return None
+    return None
 
 
 def generate_mpesa_reference(user_id, project_id=None):
@@ -277,19 +318,8 @@ def generate_mpesa_reference(user_id, project_id=None):
     Returns:
         str: Unique reference string
     """
-    import time
-    import hashlib
-
-    timestamp = int(time.time())
-    base_string = f"{user_id}_{timestamp}"
-
-    if project_id:
-        base_string += f"_{project_id}"
-
-    # Create a short hash
-    hash_obj = hashlib.md5(base_string.encode())
-    short_hash = hash_obj.hexdigest()[:8].upper()
-
-    return f"MJL{short_hash}"
+    # 4 random bytes straight from the OS CSPRNG — no MD5 pipeline, and
+    # no timestamp collisions when references are generated in a tight loop
+    return f"MJL{secrets.token_hex(4).upper()}"
 
 
@@ -7,12 +7,73 @@ Contains data validation functions:
 - Data integrity validation
 """
 
+import functools
+import operator
 import re
 import phonenumbers
 from datetime import datetime, date
+from decimal import Decimal, InvalidOperation
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+try:
+    # Optional linear-time DFA engine (pip install google-re2) for the
+    # backtracking-prone email/URL patterns — immune to ReDoS input
+    import re2 as _dfa_re
+except ImportError:
+    _dfa_re = re
+
+# Patterns compiled once at import — these validators run on every form
+# submission, so skip re's per-call cache lookup
+_PHONE_STRIP_TBL = str.maketrans('', '', ' -()')
+_KE_FAST_RE = re.compile(r'^(?:\+254|254|0)[17]\d{8}$')
+_EMAIL_RE = _dfa_re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NAME_RE = re.compile(r'^[A-Za-z\s\-\'\.]+$')
+_NAME_CONSEC_RE = re.compile(r'[\-\'\\.]{2,}')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_\.]+$')
+_USERNAME_START_RE = re.compile(r'^[a-zA-Z]')
+_LOCATION_RE = re.compile(r'^[A-Za-z0-9\s,\-\.]+$')
+_AMOUNT_RE = re.compile(r'^-?\d+(?:\.\d{1,2})?$')
+_ID_KE_OLD_RE = re.compile(r'^\d{8}$')
+_ID_KE_NEW_RE = re.compile(r'^[A-Z]\d{8}$')
+
+_DISPOSABLE_DOMAINS = frozenset([
+    'tempmail.com', 'guerrillamail.com', 'mailinator.com',
+    'sharklasers.com', 'grr.la', 'guerrillamail.net'
+])
+
+_RESERVED_USERNAMES = frozenset([
+    'admin', 'administrator', 'root', 'system', 'support',
+    'info', 'contact', 'help', 'test', 'user'
+])
+_URL_RE = _dfa_re.compile(
+    r'^https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}'
+    r'\b(?:[-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
+)
+
+# Character-class bitmasks for password checks: one table lookup per byte
+# replaces four separate regex scans over the password
+PW_UPPER, PW_LOWER, PW_DIGIT, PW_SPECIAL = 1, 2, 4, 8
+_PW_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+_PW_CLASS_TABLE = bytes(
+    (PW_UPPER if 65 <= i <= 90 else 0)
+    | (PW_LOWER if 97 <= i <= 122 else 0)
+    | (PW_DIGIT if 48 <= i <= 57 else 0)
+    | (PW_SPECIAL if chr(i) in _PW_SPECIAL_CHARS else 0)
+    for i in range(256)
+)
+
+
+def password_class_mask(value):
+    """
+    OR together the character-class bits present in a password
+
+    Non-Latin-1 characters are ignored, matching what the old ASCII
+    character classes would have found
+    """
+    data = value.encode('latin-1', 'ignore')
+    return functools.reduce(operator.or_, map(_PW_CLASS_TABLE.__getitem__, data), 0)
+
 
 def validate_phone_number(value, country='KE'):
     """
@@ -31,21 +92,34 @@ def validate_phone_number(value, country='KE'):
     if not value:
         raise ValidationError(_('Phone number is required'))
 
+    # Fast path for well-formed Kenyan numbers: one regex match and a
+    # slice instead of a metadata-trie walk through phonenumbers
+    if country == 'KE':
+        stripped = value.translate(_PHONE_STRIP_TBL)
+        if _KE_FAST_RE.match(stripped):
+            return '+254' + stripped[-9:]
+
     try:
-        # Parse phone number
-        phone = phonenumbers.parse(value, country)
+        return _parse_phone_cached(value, country)
+    except phonenumbers.NumberParseException:
+        raise ValidationError(_('Invalid phone number format'))
 
-        # Check if valid
-        if not phonenumbers.is_valid_number(phone):
-            raise ValidationError(_('Invalid phone number'))
 
-        # Format in E.164 format
-        formatted = phonenumbers.format_number(phone, phonenumbers.PhoneNumberFormat.E164)
+@functools.lru_cache(maxsize=4096)
+def _parse_phone_cached(value, country):
+    """
+    Full phonenumbers parse + validation, memoized for repeat inputs
+    (bulk imports resubmit the same numbers)
 
-        return formatted
+    Only successful results are cached — lru_cache does not store the
+    NumberParseException/ValidationError raised for bad input
+    """
+    phone = phonenumbers.parse(value, country)
 
-    except phonenumbers.NumberParseException:
-        raise ValidationError(_('Invalid phone number format'))
+    if not phonenumbers.is_valid_number(phone):
+        raise ValidationError(_('Invalid phone number'))
+
+    return phonenumbers.format_number(phone, phonenumbers.PhoneNumberFormat.E164)
 
 
 def validate_email(value):
@@ -65,19 +139,12 @@ def validate_email(value):
         raise ValidationError(_('Email address is required'))
 
     # Basic regex validation
-    email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-
-    if not re.match(email_regex, value):
+    if not _EMAIL_RE.match(value):
         raise ValidationError(_('Enter a valid email address'))
 
     # Check for disposable email domains (simplified)
-    disposable_domains = [
-        'tempmail.com', 'guerrillamail.com', 'mailinator.com',
-        'sharklasers.com', 'grr.la', 'guerrillamail.net'
-    ]
-
     domain = value.split('@')[1].lower()
-    if domain in disposable_domains:
+    if domain in _DISPOSABLE_DOMAINS:
         raise ValidationError(_('Disposable email addresses are not allowed'))
 
     return value
@@ -100,8 +167,32 @@ def validate_name(value, field_name='Name'):
     if not value:
         raise ValidationError(_(f'{field_name} is required'))
 
-    # Remove extra whitespace
-    value = ' '.join(value.strip().split())
+    # One fused pass collapses whitespace, validates characters, and
+    # catches consecutive specials — instead of join/split plus two
+    # regex walks over the same string
+    out = []
+    prev_special = False
+    prev_space = True
+    for c in value.strip():
+        if 'a' <= c <= 'z' or 'A' <= c <= 'Z':
+            out.append(c)
+            prev_space = prev_special = False
+        elif c.isspace():
+            if not prev_space:
+                out.append(' ')
+                prev_space = True
+            prev_special = False
+        elif c in "-'.":
+            if prev_special:
+                raise ValidationError(_(f'{field_name} cannot have consecutive special characters'))
+            out.append(c)
+            prev_space = False
+            prev_special = True
+        else:
+            raise ValidationError(
+                _(f'{field_name} can only contain letters, spaces, hyphens, apostrophes, and periods'))
+
+    value = ''.join(out)
 
     # Check length
     if len(value) < 2:
@@ -110,14 +201,6 @@ def validate_name(value, field_name='Name'):
     if len(value) > 100:
         raise ValidationError(_(f'{field_name} cannot exceed 100 characters'))
 
-    # Check for valid characters (letters, spaces, hyphens, apostrophes)
-    if not re.match(r'^[A-Za-z\s\-\'\.]+$', value):
-        raise ValidationError(_(f'{field_name} can only contain letters, spaces, hyphens, apostrophes, and periods'))
-
-    # Check for consecutive special characters
-    if re.search(r'[\-\'\\.]{2,}', value):
-        raise ValidationError(_(f'{field_name} cannot have consecutive special characters'))
-
     return value
 
 
@@ -144,20 +227,19 @@ def validate_password(value):
     if len(value) > 128:
         raise ValidationError(_('Password cannot exceed 128 characters'))
 
-    # Check for at least one uppercase letter
-    if not re.search(r'[A-Z]', value):
+    # One pass over the password collects all four class flags
+    mask = password_class_mask(value)
+
+    if not mask & PW_UPPER:
         raise ValidationError(_('Password must contain at least one uppercase letter'))
 
-    # Check for at least one lowercase letter
-    if not re.search(r'[a-z]', value):
+    if not mask & PW_LOWER:
         raise ValidationError(_('Password must contain at least one lowercase letter'))
 
-    # Check for at least one digit
-    if not re.search(r'\d', value):
+    if not mask & PW_DIGIT:
         raise ValidationError(_('Password must contain at least one digit'))
 
-    # Check for at least one special character
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', value):
+    if not mask & PW_SPECIAL:
         raise ValidationError(_('Password must contain at least one special character'))
 
     return value
@@ -187,18 +269,15 @@ def validate_username(value):
         raise ValidationError(_('Username cannot exceed 30 characters'))
 
     # Check for valid characters
-    if not re.match(r'^[a-zA-Z0-9_\.]+$', value):
+    if not _USERNAME_RE.match(value):
         raise ValidationError(_('Username can only contain letters, numbers, underscores, and periods'))
 
     # Check if starts with letter
-    if not re.match(r'^[a-zA-Z]', value):
+    if not _USERNAME_START_RE.match(value):
         raise ValidationError(_('Username must start with a letter'))
 
     # Check for reserved usernames
-    reserved = ['admin', 'administrator', 'root', 'system', 'support',
-                'info', 'contact', 'help', 'test', 'user']
-
-    if value.lower() in reserved:
+    if value.lower() in _RESERVED_USERNAMES:
         raise ValidationError(_('This username is not available'))
 
     return value
@@ -227,12 +306,16 @@ def validate_date(value, min_date=None, max_date=None):
         value = value.date()
 
     if not isinstance(value, date):
+        if not isinstance(value, str):
+            raise ValidationError(_('Invalid date format'))
+
+        # Parse the fixed YYYY-MM-DD shape directly — skips strptime's
+        # per-call format parsing and locale machinery on bulk imports
+        if (len(value) != 10 or value[4] != '-' or value[7] != '-'
+                or not (value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit())):
+            raise ValidationError(_('Invalid date format. Use YYYY-MM-DD'))
         try:
-            # Try to parse string
-            if isinstance(value, str):
-                value = datetime.strptime(value, '%Y-%m-%d').date()
-            else:
-                raise ValidationError(_('Invalid date format'))
+            value = date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
         except ValueError:
             raise ValidationError(_('Invalid date format. Use YYYY-MM-DD'))
 
@@ -256,12 +339,12 @@ def validate_amount(value, min_amount=0.01, max_amount=10000000):
     Validate monetary amount
 
     Args:
-        value: Amount (can be string, int, or float)
+        value: Amount (can be string, int, float, or Decimal)
         min_amount: Minimum allowed amount
         max_amount: Maximum allowed amount
 
     Returns:
-        float: Validated amount
+        Decimal: Validated amount with up to 2 decimal places
 
     Raises:
         ValidationError: If amount is invalid
@@ -269,27 +352,29 @@ def validate_amount(value, min_amount=0.01, max_amount=10000000):
     if value is None:
         raise ValidationError(_('Amount is required'))
 
+    # One anchored match validates format and decimal places together;
+    # Decimal keeps monetary values exact where float would not
+    if isinstance(value, str):
+        value = value.replace(',', '').strip()
+    else:
+        value = str(value)
+
+    if not _AMOUNT_RE.match(value):
+        raise ValidationError(_('Invalid amount'))
+
     try:
-        # Convert to float
-        if isinstance(value, str):
-            value = float(value.replace(',', ''))
-        else:
-            value = float(value)
-    except (ValueError, TypeError):
+        amount = Decimal(value)
+    except InvalidOperation:
         raise ValidationError(_('Invalid amount'))
 
-    # Check range
-    if value < min_amount:
+    # Check range (bounds go through str so float defaults stay exact)
+    if amount < Decimal(str(min_amount)):
         raise ValidationError(_(f'Amount must be at least {min_amount}'))
 
-    if value > max_amount:
+    if amount > Decimal(str(max_amount)):
         raise ValidationError(_(f'Amount cannot exceed {max_amount}'))
 
-    # Check decimal places
-    if not (0 <= value - int(value) < 1):
-        raise ValidationError(_('Amount can have up to 2 decimal places'))
-
-    return round(value, 2)
+    return amount
 
 
 def validate_location(value):
@@ -318,8 +403,11 @@ def validate_location(value):
         raise ValidationError(_('Location cannot exceed 200 characters'))
 
     # Check for valid characters (allow letters, numbers, spaces, commas, hyphens)
-    if not re.match(r'^[A-Za-z0-9\s,\-\.]+$', value):
-        raise ValidationError(_('Location can only contain letters, numbers, spaces, commas, hyphens, and periods'))
+    # 'Town, Area' style input passes on cheap C-level scans; anything
+    # else falls through to the full character-class regex
+    if not (value.isascii() and value.replace(' ', '').replace(',', '').isalnum()):
+        if not _LOCATION_RE.match(value):
+            raise ValidationError(_('Location can only contain letters, numbers, spaces, commas, hyphens, and periods'))
 
     return value
 
@@ -347,16 +435,18 @@ def validate_id_number(value, country='KE'):
         # Kenya ID validation (simplified)
         # Format: 8 digits (old) or 1 letter + 8 digits (new)
 
+        # One anchored match per format — no substring copy or
+        # per-character class checks
         if len(value) not in [8, 9]:
             raise ValidationError(_('ID number must be 8 or 9 characters'))
 
         if len(value) == 9:
             # New format: 1 letter + 8 digits
-            if not (value[0].isalpha() and value[1:].isdigit()):
+            if not _ID_KE_NEW_RE.match(value):
                 raise ValidationError(_('Invalid ID number format. Expected: 1 letter followed by 8 digits'))
         else:
             # Old format: 8 digits
-            if not value.isdigit():
+            if not _ID_KE_OLD_RE.match(value):
                 raise ValidationError(_('ID number must contain only digits'))
 
     return value
@@ -379,11 +469,14 @@ def validate_postal_code(value, country='KE'):
     if not value:
         return value  # Postal code can be optional
 
-    value = value.strip()
+    # Strip only when there is whitespace to strip
+    if value[0].isspace() or value[-1].isspace():
+        value = value.strip()
 
     if country == 'KE':
-        # Kenya postal codes: 5 digits
-        if not re.match(r'^\d{5}$', value):
+        # Kenya postal codes: 5 digits — a length check plus one C-level
+        # digit scan beats regex setup at this size
+        if len(value) != 5 or not value.isdigit():
             raise ValidationError(_('Postal code must be 5 digits'))
 
     return value
@@ -409,9 +502,7 @@ def validate_url(value, require_https=False):
     value = value.strip()
 
     # Basic URL validation
-    url_regex = r'^https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
-
-    if not re.match(url_regex, value):
+    if not _URL_RE.match(value):
         raise ValidationError(_('Enter a valid URL'))
 
     if require_https and not value.startswith('https://'):
@@ -451,3 +542,209 @@ def validate_text_length(value, field_name, min_length=1, max_length=5000):
     return value
 
 
+# ---------------------------------------------------------------------------
+# Fused form validators
+# ---------------------------------------------------------------------------
+# Source fragments inlined by build_validator. Each mirrors the checks of
+# the standalone validator of the same name and short-circuits on the first
+# failure — keep them in sync when the validators above change. 'phone'
+# delegates to validate_phone_number since its fast path is already one call.
+_FIELD_SNIPPETS = {
+    'email': """
+    v = data.get({field!r}) or ''
+    if not v:
+        raise ValidationError(_('Email address is required'))
+    if not _EMAIL_RE.match(v):
+        raise ValidationError(_('Enter a valid email address'))
+    if v.split('@')[1].lower() in _DISPOSABLE_DOMAINS:
+        raise ValidationError(_('Disposable email addresses are not allowed'))
+    cleaned[{field!r}] = v
+""",
+    'name': """
+    v = data.get({field!r}) or ''
+    if not v:
+        raise ValidationError(_('Name is required'))
+    v = ' '.join(v.strip().split())
+    if len(v) < 2:
+        raise ValidationError(_('Name must be at least 2 characters long'))
+    if len(v) > 100:
+        raise ValidationError(_('Name cannot exceed 100 characters'))
+    if not _NAME_RE.match(v):
+        raise ValidationError(_('Name can only contain letters, spaces, hyphens, apostrophes, and periods'))
+    if _NAME_CONSEC_RE.search(v):
+        raise ValidationError(_('Name cannot have consecutive special characters'))
+    cleaned[{field!r}] = v
+""",
+    'username': """
+    v = data.get({field!r}) or ''
+    if not v:
+        raise ValidationError(_('Username is required'))
+    if len(v) < 3:
+        raise ValidationError(_('Username must be at least 3 characters long'))
+    if len(v) > 30:
+        raise ValidationError(_('Username cannot exceed 30 characters'))
+    if not _USERNAME_RE.match(v):
+        raise ValidationError(_('Username can only contain letters, numbers, underscores, and periods'))
+    if not _USERNAME_START_RE.match(v):
+        raise ValidationError(_('Username must start with a letter'))
+    if v.lower() in _RESERVED_USERNAMES:
+        raise ValidationError(_('This username is not available'))
+    cleaned[{field!r}] = v
+""",
+    'password': """
+    v = data.get({field!r}) or ''
+    if not v:
+        raise ValidationError(_('Password is required'))
+    if len(v) < 8:
+        raise ValidationError(_('Password must be at least 8 characters long'))
+    if len(v) > 128:
+        raise ValidationError(_('Password cannot exceed 128 characters'))
+    mask = password_class_mask(v)
+    if not mask & PW_UPPER:
+        raise ValidationError(_('Password must contain at least one uppercase letter'))
+    if not mask & PW_LOWER:
+        raise ValidationError(_('Password must contain at least one lowercase letter'))
+    if not mask & PW_DIGIT:
+        raise ValidationError(_('Password must contain at least one digit'))
+    if not mask & PW_SPECIAL:
+        raise ValidationError(_('Password must contain at least one special character'))
+    cleaned[{field!r}] = v
+""",
+    'location': """
+    v = (data.get({field!r}) or '').strip()
+    if not v:
+        raise ValidationError(_('Location is required'))
+    if len(v) < 3:
+        raise ValidationError(_('Location must be at least 3 characters long'))
+    if len(v) > 200:
+        raise ValidationError(_('Location cannot exceed 200 characters'))
+    if not _LOCATION_RE.match(v):
+        raise ValidationError(_('Location can only contain letters, numbers, spaces, commas, hyphens, and periods'))
+    cleaned[{field!r}] = v
+""",
+    'phone': """
+    cleaned[{field!r}] = validate_phone_number(data.get({field!r}))
+""",
+}
+
+_built_validators = {}
+
+
+def build_validator(spec):
+    """
+    Build a fused validator for a known form schema
+
+    Generates one function that inlines the checks for every field in
+    spec, so validating a submission costs a single call instead of one
+    dispatch (plus regex fetches) per field. Compiled validators are
+    cached per schema.
+
+    Args:
+        spec: Mapping of field name -> snippet kind
+              (one of 'email', 'name', 'username', 'password',
+              'location', 'phone')
+
+    Returns:
+        callable: validator(data) -> dict of cleaned values, raising
+                  ValidationError on the first invalid field
+
+    Raises:
+        KeyError: If spec references an unknown snippet kind
+    """
+    key = tuple(sorted(spec.items()))
+    validator = _built_validators.get(key)
+    if validator is not None:
+        return validator
+
+    lines = ['def _validator(data):', '    cleaned = {}']
+    for field, kind in spec.items():
+        lines.append(_FIELD_SNIPPETS[kind].format(field=field))
+    lines.append('    return cleaned')
+
+    namespace = {}
+    exec(compile('\n'.join(lines), '<built validator>', 'exec'), globals(), namespace)
+
+    validator = _built_validators[key] = namespace['_validator']
+    return validator
+
+# ---------------------------------------------------------------------------
+# Non-raising variants for bulk paths
+# ---------------------------------------------------------------------------
+# Raising ValidationError allocates a lazy translated string, an exception
+# instance, and a stack unwind per bad row — far more than a tuple return.
+# Bulk import loops should use these; Django form integration keeps the
+# raising validators above. Error keys translate at the display boundary.
+
+
+def validate_email_fast(value):
+    """
+    Tuple-returning validate_email for bulk loops
+
+    Returns:
+        tuple: (ok, error_key, value) — error_key is '' when ok
+    """
+    if not value:
+        return False, 'email_required', value
+    if not _EMAIL_RE.match(value):
+        return False, 'email_invalid', value
+    if value.split('@')[1].lower() in _DISPOSABLE_DOMAINS:
+        return False, 'email_disposable', value
+    return True, '', value
+
+
+def validate_phone_number_fast(value, country='KE'):
+    """
+    Tuple-returning validate_phone_number for bulk loops
+
+    Returns:
+        tuple: (ok, error_key, formatted_value)
+    """
+    if not value:
+        return False, 'phone_required', value
+    if country == 'KE':
+        stripped = value.translate(_PHONE_STRIP_TBL)
+        if _KE_FAST_RE.match(stripped):
+            return True, '', '+254' + stripped[-9:]
+    try:
+        return True, '', _parse_phone_cached(value, country)
+    except (phonenumbers.NumberParseException, ValidationError):
+        return False, 'phone_invalid', value
+
+
+def validate_name_fast(value):
+    """
+    Tuple-returning validate_name for bulk loops
+
+    Returns:
+        tuple: (ok, error_key, normalized_value)
+    """
+    if not value:
+        return False, 'name_required', value
+
+    out = []
+    prev_special = False
+    prev_space = True
+    for c in value.strip():
+        if 'a' <= c <= 'z' or 'A' <= c <= 'Z':
+            out.append(c)
+            prev_space = prev_special = False
+        elif c.isspace():
+            if not prev_space:
+                out.append(' ')
+                prev_space = True
+            prev_special = False
+        elif c in "-'.":
+            if prev_special:
+                return False, 'name_consecutive_specials', value
+            out.append(c)
+            prev_space = False
+            prev_special = True
+        else:
+            return False, 'name_invalid_characters', value
+
+    normalized = ''.join(out)
+    if len(normalized) < 2:
+        return False, 'name_too_short', normalized
+    if len(normalized) > 100:
+        return False, 'name_too_long', normalized
+    return True, '', normalized
@@ -8,21 +8,91 @@ Contains views for:
 - Error page customization
 """
 
+import functools
+
 from django.shortcuts import render, redirect
 from django.views.generic import TemplateView, ListView, FormView, CreateView
 from django.views.generic.edit import FormView
 from django.contrib import messages
-from django.urls import reverse_lazy
+from django.urls import reverse
 from django.core.paginator import Paginator
 from django.db.models import Q
 from django.core.mail import send_mail
 from django.conf import settings
-from django.http import JsonResponse
 
+from types import MappingProxyType
+
+from .http import ORJSONResponse
 from .models import SiteSetting, ContactMessage, Testimonial, FAQ, NewsletterSubscriber
 from .forms import ContactForm, NewsletterForm
+from .utils.helpers import (
+    get_active_faqs,
+    get_contact_faqs,
+    get_faq_categories,
+    get_faqs_by_category,
+    get_site_settings,
+)
 # from .sitemaps import StaticViewSitemap
 
+# Static page content built once at import — templates only read these,
+# so every request shares the same objects instead of re-allocating them
+
+# Mock stats (in production, these would come from database)
+HOME_STATS = MappingProxyType({
+    'verified_artisans': 2500,
+    'projects_completed': 15000,
+    'satisfaction_rate': 98,
+    'support_availability': '24/7',
+    'average_rating': 4.8,
+})
+
+# Trade categories for the homepage grid
+HOME_TRADES = (
+    {'name': 'Plumbers', 'icon': 'bi-droplet'},
+    {'name': 'Electricians', 'icon': 'bi-lightning-charge'},
+    {'name': 'Masons', 'icon': 'bi-bricks'},
+    {'name': 'Carpenters', 'icon': 'bi-tools'},
+    {'name': 'Painters', 'icon': 'bi-brush'},
+    {'name': 'Welders', 'icon': 'bi-wrench'},
+    {'name': 'Roofers', 'icon': 'bi-house-door'},
+    {'name': 'Tilers', 'icon': 'bi-grid-3x3-gap'},
+    {'name': 'Landscapers', 'icon': 'bi-tree'},
+    {'name': 'Interior Designers', 'icon': 'bi-columns-gap'},
+)
+
+# All available trades for the services page
+SERVICE_TRADES = (
+    {'name': 'Plumbing', 'icon': 'bi-droplet',
+     'description': 'Pipe installation, drainage systems, water heater installation'},
+    {'name': 'Electrical', 'icon': 'bi-lightning-charge',
+     'description': 'Wiring, lighting installation, electrical repairs'},
+    {'name': 'Masonry', 'icon': 'bi-bricks', 'description': 'Brickwork, concrete work, foundation laying'},
+    {'name': 'Carpentry', 'icon': 'bi-tools',
+     'description': 'Furniture making, roofing, flooring installation'},
+    {'name': 'Painting', 'icon': 'bi-brush', 'description': 'Interior/exterior painting, wall finishing'},
+    {'name': 'Welding', 'icon': 'bi-wrench', 'description': 'Metal fabrication, gates, railings'},
+    {'name': 'Roofing', 'icon': 'bi-house-door', 'description': 'Roof installation, repair, waterproofing'},
+    {'name': 'Tiling', 'icon': 'bi-grid-3x3-gap', 'description': 'Floor tiling, wall tiling, pattern design'},
+    {'name': 'Landscaping', 'icon': 'bi-tree', 'description': 'Garden design, lawn installation, irrigation'},
+    {'name': 'Interior Design', 'icon': 'bi-columns-gap',
+     'description': 'Space planning, color consultation, furniture selection'},
+)
+
+# Verification process steps for the safety page
+VERIFICATION_STEPS = (
+    {'step': 1, 'title': 'ID Verification', 'description': 'Government-issued ID validation'},
+    {'step': 2, 'title': 'Skill Assessment', 'description': 'Trade-specific competency evaluation'},
+    {'step': 3, 'title': 'Reference Checks', 'description': 'Contacting previous clients'},
+    {'step': 4, 'title': 'Document Review', 'description': 'Certificates and portfolio verification'},
+    {'step': 5, 'title': 'Background Check', 'description': 'Security and integrity screening'},
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved_url(name):
+    """Reverse a URL name once per process — reverse_lazy re-resolves on every access"""
+    return reverse(name)
+
 
 class HomeView(TemplateView):
     """
@@ -40,48 +110,30 @@ class HomeView(TemplateView):
         context = super().get_context_data(**kwargs)
 
         # Get site settings
-        context['site_settings'] = SiteSetting.objects.first()
+        context['site_settings'] = get_site_settings()
 
-        # Get featured testimonials
-        context['testimonials'] = Testimonial.objects.filter(is_featured=True)[:3]
+        # Get featured testimonials (only the fields the cards render)
+        context['testimonials'] = Testimonial.objects.filter(is_featured=True).only(
+            'client_name', 'client_location', 'client_type', 'content', 'rating', 'client_photo'
+        )[:3]
 
         # Get FAQ categories for dropdown
-        context['faq_categories'] = FAQ.objects.filter(is_active=True).values_list('category', flat=True).distinct()
+        context['faq_categories'] = get_faq_categories()
 
-        # Mock stats (in production, these would come from database)
-        context['stats'] = {
-            'verified_artisans': 2500,
-            'projects_completed': 15000,
-            'satisfaction_rate': 98,
-            'support_availability': '24/7',
-            'average_rating': 4.8,
-        }
+        context['stats'] = HOME_STATS
 
         # Trade categories for the grid
-        context['trades'] = [
-            {'name': 'Plumbers', 'icon': 'bi-droplet'},
-            {'name': 'Electricians', 'icon': 'bi-lightning-charge'},
-            {'name': 'Masons', 'icon': 'bi-bricks'},
-            {'name': 'Carpenters', 'icon': 'bi-tools'},
-            {'name': 'Painters', 'icon': 'bi-brush'},
-            {'name': 'Welders', 'icon': 'bi-wrench'},
-            {'name': 'Roofers', 'icon': 'bi-house-door'},
-            {'name': 'Tilers', 'icon': 'bi-grid-3x3-gap'},
-            {'name': 'Landscapers', 'icon': 'bi-tree'},
-            {'name': 'Interior Designers', 'icon': 'bi-columns-gap'},
-        ]
+        context['trades'] = HOME_TRADES
 
         return context
 
 
-class AboutView(TemplateView):
-    """About Us page"""
-    template_name = 'core/about.html'
+# The static information pages are plain functions — they render one
+# template with the cached SiteSetting, so CBV dispatch is pure overhead
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        return context
+def about(request):
+    """About Us page"""
+    return render(request, 'core/about.html', {'site_settings': get_site_settings()})
 
 
 class ServicesView(TemplateView):
@@ -90,51 +142,34 @@ class ServicesView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
+        context['site_settings'] = get_site_settings()
 
         # All available trades for services page
-        context['trades'] = [
-            {'name': 'Plumbing', 'icon': 'bi-droplet',
-             'description': 'Pipe installation, drainage systems, water heater installation'},
-            {'name': 'Electrical', 'icon': 'bi-lightning-charge',
-             'description': 'Wiring, lighting installation, electrical repairs'},
-            {'name': 'Masonry', 'icon': 'bi-bricks', 'description': 'Brickwork, concrete work, foundation laying'},
-            {'name': 'Carpentry', 'icon': 'bi-tools',
-             'description': 'Furniture making, roofing, flooring installation'},
-            {'name': 'Painting', 'icon': 'bi-brush', 'description': 'Interior/exterior painting, wall finishing'},
-            {'name': 'Welding', 'icon': 'bi-wrench', 'description': 'Metal fabrication, gates, railings'},
-            {'name': 'Roofing', 'icon': 'bi-house-door', 'description': 'Roof installation, repair, waterproofing'},
-            {'name': 'Tiling', 'icon': 'bi-grid-3x3-gap', 'description': 'Floor tiling, wall tiling, pattern design'},
-            {'name': 'Landscaping', 'icon': 'bi-tree', 'description': 'Garden design, lawn installation, irrigation'},
-            {'name': 'Interior Design', 'icon': 'bi-columns-gap',
-             'description': 'Space planning, color consultation, furniture selection'},
-        ]
+        context['trades'] = SERVICE_TRADES
 
         return context
 
 
-class HowItWorksView(TemplateView):
+def how_it_works(request):
     """How It Works page"""
-    template_name = 'core/how-it-works.html'
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        return context
+    return render(request, 'core/how-it-works.html', {'site_settings': get_site_settings()})
 
 
 class ContactView(FormView):
     """Contact page with form"""
     template_name = 'core/contact.html'
     form_class = ContactForm
-    success_url = reverse_lazy('contact')
+
+    def get_success_url(self):
+        return _resolved_url('core:contact')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
+        context['site_settings'] = get_site_settings()
 
         # Get FAQs for contact page
-        context['faqs'] = FAQ.objects.filter(is_active=True, category__in=['general', 'payments', 'safety'])[:5]
+        # General, Payments and Safety & Trust categories
+        context['faqs'] = get_contact_faqs()
 
         return context
 
@@ -172,47 +207,41 @@ class ContactSubmitView(CreateView):
 
         # Return JSON response for AJAX calls
         if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': True,
                 'message': 'Thank you for your message! We will contact you soon.'
             })
 
         messages.success(self.request, 'Thank you for your message!')
-        return redirect('contact')
+        return redirect('core:contact')
 
     def form_invalid(self, form):
         """Handle invalid form submission"""
         if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': False,
-                'errors': form.errors
+                'errors': form.errors.get_json_data()
             })
 
         messages.error(self.request, 'Please correct the errors below.')
-        return redirect('contact')
+        return redirect('core:contact')
 
 
 class NewsletterSubscribeView(FormView):
     """Newsletter subscription"""
     form_class = NewsletterForm
-    success_url = reverse_lazy('home')
+
+    def get_success_url(self):
+        return _resolved_url('core:home')
 
     def form_valid(self, form):
         """Process newsletter subscription"""
-        email = form.cleaned_data['email']
-
-        # Check if already subscribed
-        subscriber, created = NewsletterSubscriber.objects.get_or_create(
-            email=email,
-            defaults={'is_active': True}
-        )
-
-        if not created and not subscriber.is_active:
-            subscriber.is_active = True
-            subscriber.save()
+        # form.save() holds the one upsert implementation (single
+        # INSERT ... ON CONFLICT DO UPDATE, lowercased email)
+        form.save()
 
         if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': True,
                 'message': 'Thank you for subscribing to our newsletter!'
             })
@@ -223,13 +252,13 @@ class NewsletterSubscribeView(FormView):
     def form_invalid(self, form):
         """Handle invalid subscription"""
         if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': False,
-                'errors': form.errors
+                'errors': form.errors.get_json_data()
             })
 
         messages.error(self.request, 'Please enter a valid email address.')
-        return redirect('home')
+        return redirect('core:home')
 
 
 class NewsletterUnsubscribeView(TemplateView):
@@ -240,55 +269,34 @@ class NewsletterUnsubscribeView(TemplateView):
         """Handle unsubscribe request"""
         email = kwargs.get('email')
 
-        try:
-            subscriber = NewsletterSubscriber.objects.get(email=email)
-            subscriber.is_active = False
-            subscriber.save()
+        # One conditional UPDATE instead of SELECT-then-save; the row
+        # count tells us whether the email was subscribed at all
+        # (addresses are stored lowercased, so match on the lowered input)
+        updated = NewsletterSubscriber.objects.filter(email=email.lower()).update(is_active=False)
+        if updated:
             messages.success(request, f'{email} has been unsubscribed from our newsletter.')
-        except NewsletterSubscriber.DoesNotExist:
+        else:
             messages.info(request, 'This email was not subscribed to our newsletter.')
 
         return super().get(request, *args, **kwargs)
 
 
-class PrivacyPolicyView(TemplateView):
+def privacy_policy(request):
     """Privacy Policy page"""
-    template_name = 'core/privacy_policy.html'
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        return context
+    return render(request, 'core/privacy_policy.html', {'site_settings': get_site_settings()})
 
 
-class TermsOfServiceView(TemplateView):
+def terms_of_service(request):
     """Terms of Service page"""
-    template_name = 'core/terms_of_service.html'
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        return context
+    return render(request, 'core/terms_of_service.html', {'site_settings': get_site_settings()})
 
 
-class SafetyTrustView(TemplateView):
+def safety_trust(request):
     """Safety & Trust page"""
-    template_name = 'core/safety_trust.html'
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-
-        # Get verification process steps
-        context['verification_steps'] = [
-            {'step': 1, 'title': 'ID Verification', 'description': 'Government-issued ID validation'},
-            {'step': 2, 'title': 'Skill Assessment', 'description': 'Trade-specific competency evaluation'},
-            {'step': 3, 'title': 'Reference Checks', 'description': 'Contacting previous clients'},
-            {'step': 4, 'title': 'Document Review', 'description': 'Certificates and portfolio verification'},
-            {'step': 5, 'title': 'Background Check', 'description': 'Security and integrity screening'},
-        ]
-
-        return context
+    return render(request, 'core/safety_trust.html', {
+        'site_settings': get_site_settings(),
+        'verification_steps': VERIFICATION_STEPS,
+    })
 
 
 class HelpCenterView(TemplateView):
@@ -297,8 +305,14 @@ class HelpCenterView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        context['faqs'] = FAQ.objects.filter(is_active=True)
+        context['site_settings'] = get_site_settings()
+
+        # Page over the cached rows so the template renders a bounded
+        # slice however large the FAQ table grows
+        paginator = Paginator(get_active_faqs(), 20)
+        page = paginator.get_page(self.request.GET.get('page'))
+        context['faqs'] = page.object_list
+        context['page_obj'] = page
         return context
 
 
@@ -306,24 +320,19 @@ class FAQView(ListView):
     """FAQ page with categorized questions"""
     template_name = 'core/faq.html'
     context_object_name = 'faqs'
+    paginate_by = 20
 
     def get_queryset(self):
-        """Get FAQs grouped by category"""
-        return FAQ.objects.filter(is_active=True).order_by('category', 'order')
+        """Get active FAQs in display order, served from cache"""
+        return get_active_faqs()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-
-        # Group FAQs by category
-        faqs_by_category = {}
-        for faq in context['faqs']:
-            category = faq.get_category_display()
-            if category not in faqs_by_category:
-                faqs_by_category[category] = []
-            faqs_by_category[category].append(faq)
+        context['site_settings'] = get_site_settings()
 
-        context['faqs_by_category'] = faqs_by_category
+        # Grouping is cached alongside the FAQ rows, so the per-request
+        # loop disappears on cache hits
+        context['faqs_by_category'] = get_faqs_by_category()
         return context
 
 
@@ -333,7 +342,7 @@ class SearchView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
+        context['site_settings'] = get_site_settings()
 
         query = self.request.GET.get('q', '')
         context['query'] = query
@@ -344,62 +353,43 @@ class SearchView(TemplateView):
             from projects.models import Project
             from users.models import ArtisanProfile
 
-            # Search projects
-            projects = Project.objects.filter(
+            # Search projects — evaluated eagerly so has_results and the
+            # template reuse the same rows instead of re-querying
+            projects = list(Project.objects.select_related('homeowner').filter(
                 Q(title__icontains=query) |
                 Q(description__icontains=query) |
                 Q(category__icontains=query)
-            ).filter(status='posted')[:10]
+            ).filter(status='posted')[:10])
 
-            # Search artisans
-            artisans = ArtisanProfile.objects.filter(
+            # Search artisans (user joined up front for the name columns)
+            artisans = list(ArtisanProfile.objects.select_related('user').filter(
                 Q(user__first_name__icontains=query) |
                 Q(user__last_name__icontains=query) |
                 Q(trade__icontains=query) |
                 Q(skills__icontains=query)
-            ).filter(is_verified=True)[:10]
+            ).filter(is_verified=True)[:10])
 
-            # Search FAQs
-            faqs = FAQ.objects.filter(
+            # Search FAQs (results only show the matched text columns)
+            faqs = list(FAQ.objects.only('question', 'answer').filter(
                 Q(question__icontains=query) |
                 Q(answer__icontains=query)
-            ).filter(is_active=True)[:10]
+            ).filter(is_active=True)[:10])
 
             context['projects'] = projects
             context['artisans'] = artisans
             context['faqs'] = faqs
-            context['has_results'] = any([projects.exists(), artisans.exists(), faqs.exists()])
+            context['has_results'] = bool(projects or artisans or faqs)
 
         return context
 
 
-class Error404View(TemplateView):
+def error_404(request):
     """Custom 404 error page"""
-    template_name = 'core/404.html'
+    return render(request, 'core/404.html', {'site_settings': get_site_settings()}, status=404)
 
-    def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-        response.status_code = 404
-        return response
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        return context
-
-
-class Error500View(TemplateView):
+def error_500(request):
     """Custom 500 error page"""
-    template_name = 'core/500.html'
-
-    def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-        response.status_code = 500
-        return response
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['site_settings'] = SiteSetting.objects.first()
-        return context
+    return render(request, 'core/500.html', {'site_settings': get_site_settings()}, status=500)
 
 
@@ -10,11 +10,15 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# True when running under `manage.py test` or pytest
+TESTING = 'test' in sys.argv or 'pytest' in sys.modules
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
@@ -89,6 +93,38 @@ DATABASES = {
     }
 }
 
+if TESTING:
+    # Make the in-memory test database explicit — keeps test runs free of
+    # file I/O even if the default NAME above changes
+    DATABASES['default']['TEST'] = {'NAME': ':memory:'}
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# 'pages' backs the cache_page-wrapped static views in core/urls.py and is
+# cleared wholesale when FAQ/Testimonial/SiteSetting content changes.
+# Point both at Redis/memcached in production.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
+}
+
+if TESTING:
+    # Cached pages would leak between tests in the same process, and the
+    # test client needs response.context from a real render
+    CACHES['pages'] = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+
+# Testing notes:
+# - Test classes inherit django.test.TestCase (savepoint-wrapped), never
+#   TransactionTestCase — keep it that way so each test rolls back cheaply.
+# - Run `manage.py test --keepdb` to reuse the schema between runs.
+# - With SQLite the test database is in-memory by default, and Django only
+#   serializes test data when a test asks for serialized_rollback.
+
 # AUTHENTICATION
 # ============================================================
 AUTH_USER_MODEL = 'auth.User'
@@ -110,6 +146,14 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+if TESTING:
+    # PBKDF2's hash stretching dominates test time for every
+    # create_user/login — MD5 is fine for throwaway test credentials
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    # Collect emails in memory so tests can assert on mail.outbox
+    EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -8,22 +8,179 @@ Contains admin interfaces for:
 - M-Pesa transaction logs
 """
 
+import functools
+import hashlib
+from types import MappingProxyType
+
 from django.contrib import admin
-from django.utils.html import format_html
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.db import transaction
+from django.utils import timezone
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
 from django.urls import reverse
+
+from core.admin_mixins import ListOnlyFieldsMixin
+
 from .models import Payment, Invoice, PaymentDispute, DisputeEvidence, Wallet, Transaction
 
 
-class PaymentAdmin(admin.ModelAdmin):
+# Badge colour lookups built once at import — the badge columns render
+# once per row, and rebuilding these dicts 50+ times per changelist page
+# is avoidable allocation churn
+_BADGE = '<span class="badge bg-{}">{}</span>'
+
+_PAYMENT_STATUS_COLORS = MappingProxyType({
+    'pending': 'warning',
+    'processing': 'info',
+    'completed': 'success',
+    'failed': 'danger',
+    'cancelled': 'secondary',
+    'refunded': 'primary',
+    'disputed': 'dark',
+})
+
+_INVOICE_STATUS_COLORS = MappingProxyType({
+    'draft': 'secondary',
+    'sent': 'info',
+    'viewed': 'primary',
+    'paid': 'success',
+    'overdue': 'warning',
+    'cancelled': 'danger',
+})
+
+_DISPUTE_SEVERITY_COLORS = MappingProxyType({
+    'low': 'success',
+    'medium': 'warning',
+    'high': 'danger',
+    'critical': 'dark',
+})
+
+_DISPUTE_STATUS_COLORS = MappingProxyType({
+    'open': 'danger',
+    'under_review': 'warning',
+    'awaiting_response': 'info',
+    'resolved': 'success',
+    'closed': 'secondary',
+})
+
+_TRANSACTION_TYPE_COLORS = MappingProxyType({
+    'deposit': 'success',
+    'withdrawal': 'danger',
+    'payment': 'primary',
+    'refund': 'info',
+    'fee': 'warning',
+    'hold': 'secondary',
+    'release': 'dark',
+    'transfer': 'dark',
+})
+
+
+def _kes(value):
+    """Format an amount as its KES display string"""
+    return f"KES {value:,.2f}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _user_change_url(user_id):
+    """Admin change URL for a user id — the pk-to-URL mapping never changes,
+    so skip re-running the resolver for users repeated across rows"""
+    return reverse('admin:auth_user_change', args=[user_id])
+
+
+def _user_link(user):
+    """
+    Admin change-page link for a user, shared by the *_info columns
+
+    The name itself is rendered per call — it is user-editable, so
+    caching it would show stale names until restart.
+    """
+    if not user:
+        return '-'
+    return format_html('<a href="{}">{}</a>', _user_change_url(user.pk), user.get_full_name())
+
+
+@functools.lru_cache(maxsize=4096)
+def _project_change_url(project_id):
+    """Admin change URL for a project id, memoized like _user_change_url"""
+    return reverse('admin:projects_project_change', args=[project_id])
+
+
+def _project_link(project):
+    """Admin change-page link for a project, shared by the project_link columns"""
+    if not project:
+        return '-'
+    return format_html('<a href="{}">{}</a>', _project_change_url(project.pk), project.title)
+
+
+@functools.lru_cache(maxsize=4096)
+def _payment_change_url(payment_id):
+    """Admin change URL for a payment id, memoized like _user_change_url"""
+    return reverse('admin:payments_payment_change', args=[payment_id])
+
+
+def _prerender_badges(model, field, colors):
+    """
+    Fully rendered badge HTML per choice value
+
+    Choice values and labels are fixed at import, so the escape +
+    format work happens once per choice here instead of once per cell
+    via format_html on every changelist row.
+    """
+    return MappingProxyType({
+        value: mark_safe(_BADGE.format(colors.get(value, 'secondary'), escape(label)))
+        for value, label in model._meta.get_field(field).choices
+    })
+
+
+_PAYMENT_STATUS_BADGES = _prerender_badges(Payment, 'status', _PAYMENT_STATUS_COLORS)
+_INVOICE_STATUS_BADGES = _prerender_badges(Invoice, 'status', _INVOICE_STATUS_COLORS)
+_DISPUTE_SEVERITY_BADGES = _prerender_badges(PaymentDispute, 'severity', _DISPUTE_SEVERITY_COLORS)
+_DISPUTE_STATUS_BADGES = _prerender_badges(PaymentDispute, 'status', _DISPUTE_STATUS_COLORS)
+_TRANSACTION_TYPE_BADGES = _prerender_badges(Transaction, 'transaction_type', _TRANSACTION_TYPE_COLORS)
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches COUNT(*) results for a minute
+
+    The admin runs a full-table count on every changelist page, which
+    grows linearly with the payment/transaction tables. The count is
+    keyed on the filtered query's SQL, so each filter combination keeps
+    its own cached total; a minute of staleness in the page count is
+    harmless for monitoring screens.
+    """
+
+    @cached_property
+    def count(self):
+        query_key = hashlib.md5(str(self.object_list.query).encode()).hexdigest()
+        return cache.get_or_set(f'admin_count:{query_key}', self.object_list.count, 60)
+
+
+class PaymentAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Payment transactions"""
+    list_only_fields = ('transaction_id', 'amount', 'payment_method', 'status', 'created_at',
+                        'payer__first_name', 'payer__last_name',
+                        'recipient__first_name', 'recipient__last_name')
     list_display = ('transaction_id', 'payer_info', 'recipient_info', 'amount_formatted',
                     'payment_method', 'status_badge', 'created_at')
     list_filter = ('status', 'payment_method', 'payment_type', 'created_at')
-    search_fields = ('transaction_id', 'payer__username', 'recipient__username',
-                     'mpesa_code', 'mpesa_receipt')
+    # '=' makes the code lookups exact matches that can use their B-tree
+    # indexes instead of '%…%' scans; usernames stay substring searches
+    search_fields = ('=transaction_id', 'payer__username', 'recipient__username',
+                     '=mpesa_code', '=mpesa_receipt')
     readonly_fields = ('transaction_id', 'created_at', 'processed_at', 'completed_at',
                        'payer_info', 'recipient_info', 'project_link')
     list_per_page = 50
+    # payer_info/recipient_info dereference FKs per row — join them up
+    # front instead of one SELECT per row per FK
+    list_select_related = ('payer', 'recipient')
+    # ID inputs instead of <select>s enumerating every user/project
+    raw_id_fields = ('payer', 'recipient', 'project', 'milestone')
+    paginator = CachedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ('Transaction Details', {
@@ -54,53 +211,31 @@ class PaymentAdmin(admin.ModelAdmin):
 
     def payer_info(self, obj):
         """Display payer information"""
-        if obj.payer:
-            url = reverse('admin:auth_user_change', args=[obj.payer.id])
-            return format_html('<a href="{}">{}</a>', url, obj.payer.get_full_name())
-        return '-'
+        return _user_link(obj.payer)
 
     payer_info.short_description = 'Payer'
 
     def recipient_info(self, obj):
         """Display recipient information"""
-        if obj.recipient:
-            url = reverse('admin:auth_user_change', args=[obj.recipient.id])
-            return format_html('<a href="{}">{}</a>', url, obj.recipient.get_full_name())
-        return '-'
+        return _user_link(obj.recipient)
 
     recipient_info.short_description = 'Recipient'
 
     def project_link(self, obj):
         """Display project link if available"""
-        if obj.project:
-            url = reverse('admin:projects_project_change', args=[obj.project.id])
-            return format_html('<a href="{}">{}</a>', url, obj.project.title)
-        return '-'
+        return _project_link(obj.project)
 
     project_link.short_description = 'Project'
 
     def amount_formatted(self, obj):
         """Format amount with KES"""
-        return f"KES {obj.amount:,.2f}"
+        return _kes(obj.amount)
 
     amount_formatted.short_description = 'Amount'
 
     def status_badge(self, obj):
         """Display status as colored badge"""
-        colors = {
-            'pending': 'warning',
-            'processing': 'info',
-            'completed': 'success',
-            'failed': 'danger',
-            'cancelled': 'secondary',
-            'refunded': 'primary',
-            'disputed': 'dark',
-        }
-        color = colors.get(obj.status, 'secondary')
-        return format_html(
-            '<span class="badge bg-{}">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _PAYMENT_STATUS_BADGES.get(obj.status, '-')
 
     status_badge.short_description = 'Status'
 
@@ -108,14 +243,18 @@ class PaymentAdmin(admin.ModelAdmin):
 
     def mark_as_completed(self, request, queryset):
         """Mark selected payments as completed"""
-        updated = queryset.update(status='completed')
+        # Stamp the timestamp in the same UPDATE so nobody has to edit
+        # the rows one-by-one afterwards
+        with transaction.atomic():
+            updated = queryset.update(status='completed', completed_at=timezone.now())
         self.message_user(request, f'{updated} payment(s) marked as completed.')
 
     mark_as_completed.short_description = "Mark as completed"
 
     def mark_as_failed(self, request, queryset):
         """Mark selected payments as failed"""
-        updated = queryset.update(status='failed')
+        with transaction.atomic():
+            updated = queryset.update(status='failed', processed_at=timezone.now())
         self.message_user(request, f'{updated} payment(s) marked as failed.')
 
     mark_as_failed.short_description = "Mark as failed"
@@ -123,20 +262,28 @@ class PaymentAdmin(admin.ModelAdmin):
     def process_refund(self, request, queryset):
         """Process refund for selected payments"""
         # In production, this would trigger actual refund logic
-        updated = queryset.update(status='refunded')
+        with transaction.atomic():
+            updated = queryset.update(status='refunded', processed_at=timezone.now())
         self.message_user(request, f'{updated} payment(s) marked as refunded.')
 
     process_refund.short_description = "Process refund"
 
 
-class InvoiceAdmin(admin.ModelAdmin):
+class InvoiceAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Invoices"""
+    list_only_fields = ('invoice_number', 'total_amount', 'status', 'due_date', 'created_at',
+                        'client__first_name', 'client__last_name',
+                        'artisan__first_name', 'artisan__last_name')
     list_display = ('invoice_number', 'client_info', 'artisan_info', 'total_amount_formatted',
                     'status_badge', 'due_date', 'created_at')
     list_filter = ('status', 'due_date', 'created_at')
     search_fields = ('invoice_number', 'client__username', 'artisan__username')
     readonly_fields = ('invoice_number', 'created_at', 'updated_at', 'sent_at', 'paid_at',
                        'client_info', 'artisan_info', 'project_link')
+    list_select_related = ('client', 'artisan')
+    raw_id_fields = ('client', 'artisan', 'project')
+    paginator = CachedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ('Invoice Details', {
@@ -163,52 +310,31 @@ class InvoiceAdmin(admin.ModelAdmin):
 
     def client_info(self, obj):
         """Display client information"""
-        if obj.client:
-            url = reverse('admin:auth_user_change', args=[obj.client.id])
-            return format_html('<a href="{}">{}</a>', url, obj.client.get_full_name())
-        return '-'
+        return _user_link(obj.client)
 
     client_info.short_description = 'Client'
 
     def artisan_info(self, obj):
         """Display artisan information"""
-        if obj.artisan:
-            url = reverse('admin:auth_user_change', args=[obj.artisan.id])
-            return format_html('<a href="{}">{}</a>', url, obj.artisan.get_full_name())
-        return '-'
+        return _user_link(obj.artisan)
 
     artisan_info.short_description = 'Artisan'
 
     def project_link(self, obj):
         """Display project link"""
-        if obj.project:
-            url = reverse('admin:projects_project_change', args=[obj.project.id])
-            return format_html('<a href="{}">{}</a>', url, obj.project.title)
-        return '-'
+        return _project_link(obj.project)
 
     project_link.short_description = 'Project'
 
     def total_amount_formatted(self, obj):
         """Format total amount"""
-        return f"KES {obj.total_amount:,.2f}"
+        return _kes(obj.total_amount)
 
     total_amount_formatted.short_description = 'Total Amount'
 
     def status_badge(self, obj):
         """Display status as colored badge"""
-        colors = {
-            'draft': 'secondary',
-            'sent': 'info',
-            'viewed': 'primary',
-            'paid': 'success',
-            'overdue': 'warning',
-            'cancelled': 'danger',
-        }
-        color = colors.get(obj.status, 'secondary')
-        return format_html(
-            '<span class="badge bg-{}">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _INVOICE_STATUS_BADGES.get(obj.status, '-')
 
     status_badge.short_description = 'Status'
 
@@ -216,18 +342,33 @@ class InvoiceAdmin(admin.ModelAdmin):
 
     def send_invoice(self, request, queryset):
         """Send selected invoices"""
-        updated = queryset.update(status='sent')
+        with transaction.atomic():
+            updated = queryset.update(status='sent', sent_at=timezone.now())
         self.message_user(request, f'{updated} invoice(s) marked as sent.')
 
     send_invoice.short_description = "Send invoice"
 
     def mark_as_paid(self, request, queryset):
         """Mark selected invoices as paid"""
-        updated = queryset.update(status='paid')
+        with transaction.atomic():
+            updated = queryset.update(status='paid', paid_at=timezone.now())
         self.message_user(request, f'{updated} invoice(s) marked as paid.')
 
     mark_as_paid.short_description = "Mark as paid"
 
+    def mark_as_overdue(self, request, queryset):
+        """Mark selected invoices as overdue"""
+        # Conditional single UPDATE: only sent/viewed invoices past
+        # their due date flip, so paid or already-overdue rows are
+        # untouched however many are selected
+        with transaction.atomic():
+            updated = queryset.filter(
+                status__in=['sent', 'viewed'], due_date__lt=timezone.now().date()
+            ).update(status='overdue')
+        self.message_user(request, f'{updated} invoice(s) marked as overdue.')
+
+    mark_as_overdue.short_description = "Mark as overdue"
+
 
 class DisputeEvidenceInline(admin.TabularInline):
     """Inline admin for dispute evidence"""
@@ -237,8 +378,11 @@ class DisputeEvidenceInline(admin.TabularInline):
     fields = ('evidence_type', 'file', 'description', 'uploaded_at')
 
 
-class PaymentDisputeAdmin(admin.ModelAdmin):
+class PaymentDisputeAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Payment Disputes"""
+    list_only_fields = ('dispute_id', 'title', 'category', 'severity', 'status', 'created_at',
+                        'raised_by__first_name', 'raised_by__last_name',
+                        'raised_against__first_name', 'raised_against__last_name')
     list_display = ('dispute_id', 'title', 'raised_by_info', 'raised_against_info',
                     'category', 'severity_badge', 'status_badge', 'created_at')
     list_filter = ('status', 'category', 'severity', 'created_at')
@@ -246,6 +390,8 @@ class PaymentDisputeAdmin(admin.ModelAdmin):
     readonly_fields = ('dispute_id', 'created_at', 'updated_at', 'resolved_at',
                        'raised_by_info', 'raised_against_info', 'payment_link', 'project_link')
     inlines = [DisputeEvidenceInline]
+    list_select_related = ('raised_by', 'raised_against')
+    raw_id_fields = ('raised_by', 'raised_against', 'payment', 'project', 'resolved_by')
 
     fieldsets = (
         ('Dispute Information', {
@@ -276,70 +422,39 @@ class PaymentDisputeAdmin(admin.ModelAdmin):
 
     def raised_by_info(self, obj):
         """Display who raised the dispute"""
-        if obj.raised_by:
-            url = reverse('admin:auth_user_change', args=[obj.raised_by.id])
-            return format_html('<a href="{}">{}</a>', url, obj.raised_by.get_full_name())
-        return '-'
+        return _user_link(obj.raised_by)
 
     raised_by_info.short_description = 'Raised By'
 
     def raised_against_info(self, obj):
         """Display who the dispute is against"""
-        if obj.raised_against:
-            url = reverse('admin:auth_user_change', args=[obj.raised_against.id])
-            return format_html('<a href="{}">{}</a>', url, obj.raised_against.get_full_name())
-        return '-'
+        return _user_link(obj.raised_against)
 
     raised_against_info.short_description = 'Raised Against'
 
     def payment_link(self, obj):
         """Display payment link"""
-        if obj.payment:
-            url = reverse('admin:payments_payment_change', args=[obj.payment.id])
-            return format_html('<a href="{}">View Payment</a>', url)
+        if obj.payment_id:
+            return format_html('<a href="{}">View Payment</a>', _payment_change_url(obj.payment_id))
         return '-'
 
     payment_link.short_description = 'Payment'
 
     def project_link(self, obj):
         """Display project link"""
-        if obj.project:
-            url = reverse('admin:projects_project_change', args=[obj.project.id])
-            return format_html('<a href="{}">{}</a>', url, obj.project.title)
-        return '-'
+        return _project_link(obj.project)
 
     project_link.short_description = 'Project'
 
     def severity_badge(self, obj):
         """Display severity as colored badge"""
-        colors = {
-            'low': 'success',
-            'medium': 'warning',
-            'high': 'danger',
-            'critical': 'dark',
-        }
-        color = colors.get(obj.severity, 'secondary')
-        return format_html(
-            '<span class="badge bg-{}">{}</span>',
-            color, obj.get_severity_display()
-        )
+        return _DISPUTE_SEVERITY_BADGES.get(obj.severity, '-')
 
     severity_badge.short_description = 'Severity'
 
     def status_badge(self, obj):
         """Display status as colored badge"""
-        colors = {
-            'open': 'danger',
-            'under_review': 'warning',
-            'awaiting_response': 'info',
-            'resolved': 'success',
-            'closed': 'secondary',
-        }
-        color = colors.get(obj.status, 'secondary')
-        return format_html(
-            '<span class="badge bg-{}">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _DISPUTE_STATUS_BADGES.get(obj.status, '-')
 
     status_badge.short_description = 'Status'
 
@@ -347,26 +462,33 @@ class PaymentDisputeAdmin(admin.ModelAdmin):
 
     def mark_as_resolved(self, request, queryset):
         """Mark selected disputes as resolved"""
-        updated = queryset.update(status='resolved', resolved_by=request.user)
+        with transaction.atomic():
+            updated = queryset.update(status='resolved', resolved_by=request.user,
+                                      resolved_at=timezone.now())
         self.message_user(request, f'{updated} dispute(s) marked as resolved.')
 
     mark_as_resolved.short_description = "Mark as resolved"
 
     def escalate_dispute(self, request, queryset):
         """Escalate selected disputes"""
-        updated = queryset.update(severity='critical')
+        with transaction.atomic():
+            updated = queryset.update(severity='critical')
         self.message_user(request, f'{updated} dispute(s) escalated to critical.')
 
     escalate_dispute.short_description = "Escalate to critical"
 
 
-class WalletAdmin(admin.ModelAdmin):
+class WalletAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Wallets"""
+    list_only_fields = ('balance', 'hold_balance', 'is_active', 'updated_at',
+                        'user__first_name', 'user__last_name')
     list_display = ('user_info', 'balance_formatted', 'hold_balance_formatted',
                     'available_balance_formatted', 'is_active', 'updated_at')
     list_filter = ('is_active', 'updated_at')
     search_fields = ('user__username', 'user__email')
     readonly_fields = ('user_info', 'created_at', 'updated_at')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
 
     fieldsets = (
         ('Wallet Information', {
@@ -387,28 +509,25 @@ class WalletAdmin(admin.ModelAdmin):
 
     def user_info(self, obj):
         """Display user information"""
-        if obj.user:
-            url = reverse('admin:auth_user_change', args=[obj.user.id])
-            return format_html('<a href="{}">{}</a>', url, obj.user.get_full_name())
-        return '-'
+        return _user_link(obj.user)
 
     user_info.short_description = 'User'
 
     def balance_formatted(self, obj):
         """Format balance"""
-        return f"KES {obj.balance:,.2f}"
+        return _kes(obj.balance)
 
     balance_formatted.short_description = 'Balance'
 
     def hold_balance_formatted(self, obj):
         """Format hold balance"""
-        return f"KES {obj.hold_balance:,.2f}"
+        return _kes(obj.hold_balance)
 
     hold_balance_formatted.short_description = 'Hold Balance'
 
     def available_balance_formatted(self, obj):
         """Format available balance"""
-        return f"KES {obj.available_balance:,.2f}"
+        return _kes(obj.available_balance)
 
     available_balance_formatted.short_description = 'Available'
 
@@ -416,26 +535,34 @@ class WalletAdmin(admin.ModelAdmin):
 
     def activate_wallets(self, request, queryset):
         """Activate selected wallets"""
-        updated = queryset.update(is_active=True)
+        with transaction.atomic():
+            updated = queryset.update(is_active=True)
         self.message_user(request, f'{updated} wallet(s) activated.')
 
     activate_wallets.short_description = "Activate wallets"
 
     def deactivate_wallets(self, request, queryset):
         """Deactivate selected wallets"""
-        updated = queryset.update(is_active=False)
+        with transaction.atomic():
+            updated = queryset.update(is_active=False)
         self.message_user(request, f'{updated} wallet(s) deactivated.')
 
     deactivate_wallets.short_description = "Deactivate wallets"
 
 
-class TransactionAdmin(admin.ModelAdmin):
+class TransactionAdmin(ListOnlyFieldsMixin, admin.ModelAdmin):
     """Admin interface for Wallet Transactions"""
+    list_only_fields = ('transaction_id', 'transaction_type', 'amount', 'created_at',
+                        'user__first_name', 'user__last_name')
     list_display = ('transaction_id', 'wallet_user', 'transaction_type_badge',
                     'amount_formatted', 'created_at')
     list_filter = ('transaction_type', 'created_at')
     search_fields = ('transaction_id', 'user__username', 'description')
     readonly_fields = ('transaction_id', 'created_at', 'wallet_user')
+    list_select_related = ('user',)
+    raw_id_fields = ('user', 'wallet')
+    paginator = CachedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ('Transaction Details', {
@@ -456,10 +583,7 @@ class TransactionAdmin(admin.ModelAdmin):
 
     def wallet_user(self, obj):
         """Display wallet user"""
-        if obj.user:
-            url = reverse('admin:auth_user_change', args=[obj.user.id])
-            return format_html('<a href="{}">{}</a>', url, obj.user.get_full_name())
-        return '-'
+        return _user_link(obj.user)
 
     wallet_user.short_description = 'User'
 
@@ -472,21 +596,7 @@ class TransactionAdmin(admin.ModelAdmin):
 
     def transaction_type_badge(self, obj):
         """Display transaction type as badge"""
-        colors = {
-            'deposit': 'success',
-            'withdrawal': 'danger',
-            'payment': 'primary',
-            'refund': 'info',
-            'fee': 'warning',
-            'hold': 'secondary',
-            'release': 'dark',
-            'transfer': 'dark',
-        }
-        color = colors.get(obj.transaction_type, 'secondary')
-        return format_html(
-            '<span class="badge bg-{}">{}</span>',
-            color, obj.get_transaction_type_display()
-        )
+        return _TRANSACTION_TYPE_BADGES.get(obj.transaction_type, '-')
 
     transaction_type_badge.short_description = 'Type'
 
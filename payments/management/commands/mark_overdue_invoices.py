@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from payments.models import Invoice
+
+
+class Command(BaseCommand):
+    """Flip sent/viewed invoices past their due date to overdue"""
+    help = (
+        "Mark sent/viewed invoices whose due date has passed as overdue. "
+        "Runs as a single conditional UPDATE, so it is safe to schedule "
+        "daily via cron regardless of how many invoices exist."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = Invoice.objects.filter(
+                status__in=['sent', 'viewed'], due_date__lt=timezone.now().date()
+            ).update(status='overdue')
+        self.stdout.write(self.style.SUCCESS(f'{updated} invoice(s) marked as overdue.'))
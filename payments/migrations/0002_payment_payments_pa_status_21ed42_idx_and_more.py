@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-28 21:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0001_initial'),
+        ('projects', '0002_alter_project_homeowner'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['status', '-created_at'], name='payments_pa_status_21ed42_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['payment_method'], name='payments_pa_payment_5c92d7_idx'),
+        ),
+    ]
@@ -91,6 +91,10 @@ class Payment(models.Model):
             models.Index(fields=['payer', 'status']),
             models.Index(fields=['recipient', 'status']),
             models.Index(fields=['project', 'status']),
+            # Admin changelist filters: status (+ default -created_at
+            # ordering) and payment method
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['payment_method']),
         ]
 
 
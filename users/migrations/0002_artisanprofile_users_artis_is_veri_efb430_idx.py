@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-28 21:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artisanprofile',
+            index=models.Index(fields=['is_verified'], name='users_artis_is_veri_efb430_idx'),
+        ),
+    ]
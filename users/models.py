@@ -85,6 +85,11 @@ class ArtisanProfile(models.Model):
 
     class Meta:
         ordering = ['-is_verified', 'user__first_name']
+        indexes = [
+            # Search only surfaces verified artisans — the index keeps
+            # the icontains stage to that subset
+            models.Index(fields=['is_verified']),
+        ]
 
 
 class ArtisanDocument(models.Model):
@@ -21,7 +21,7 @@ def register(request):
     User registration - MVP
     """
     if request.user.is_authenticated:
-        return redirect('home')
+        return redirect('core:home')
 
     if request.method == 'POST':
         form = UserRegistrationForm(request.POST)
@@ -32,7 +32,7 @@ def register(request):
 
             if user.profile.user_type == 'artisan':
                 return redirect('users:artisan_profile')
-            return redirect('home')
+            return redirect('core:home')
         else:
             # Print form errors for debugging
             print("Form errors:", form.errors)
@@ -47,7 +47,7 @@ def login_view(request):
     User login - MVP
     """
     if request.user.is_authenticated:
-        return redirect('home')
+        return redirect('core:home')
 
     if request.method == 'POST':
         username = request.POST.get('username')
@@ -82,7 +82,7 @@ def login_view(request):
                 else:
                     return redirect('projects:dashboard')
             else:
-                return redirect('home')
+                return redirect('core:home')
         else:
             messages.error(request, 'Invalid username or password.')
 
@@ -96,7 +96,7 @@ def logout_view(request):
     """
     logout(request)
     messages.info(request, 'You have been logged out.')
-    return redirect('home')
+    return redirect('core:home')
 
 
 @login_required